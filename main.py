@@ -1,29 +1,47 @@
+import argparse
 import os
 import sys
 import smtplib
 import ssl
 from io import BytesIO
+from collections import namedtuple
+from functools import lru_cache
 from email.message import EmailMessage
 from email.utils import formataddr, formatdate, make_msgid
 import requests
-import yfinance as yf
-import feedparser
-from google import genai
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import holidays
 import html
 import json
 import re
+import hashlib
+import base64
+import binascii
+import sqlite3
+from contextlib import closing
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 from bs4 import BeautifulSoup
+from lxml import html as lxml_html
 import time
+import random
 import logging
+import logging.handlers
+import queue
+import atexit
 import xml.etree.ElementTree as ET
-from urllib.parse import quote
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from urllib.parse import parse_qsl, quote, urlencode, urlsplit, urlunsplit
 from pypdf import PdfReader
 from pypdf.errors import PdfReadError
 
 # --- Holiday Check Module ---
+# Built once; each calendar fills in a year's dates on first lookup and keeps them.
+KR_MARKET_HOLIDAYS = holidays.KR()
+US_MARKET_HOLIDAYS = holidays.US(state='NY') # APPROXIMATION for NYSE holidays
+
+
 def check_holidays(today=None):
     """
     Checks if today is a KR market holiday or if the previous weekday was a US market holiday.
@@ -33,25 +51,18 @@ def check_holidays(today=None):
         today = datetime.now().date()
     
     # 1. Check KR Market Holiday (Today)
-    kr_holidays = holidays.KR()
-    is_kr_holiday = today in kr_holidays
-    holiday_name_kr = kr_holidays.get(today) if is_kr_holiday else None
+    is_kr_holiday = today in KR_MARKET_HOLIDAYS
+    holiday_name_kr = KR_MARKET_HOLIDAYS.get(today) if is_kr_holiday else None
     
     # 2. Check US Market Holiday (Previous Weekday)
     # Market close data usually comes from the previous trading day.
     # We need to check if the day we expect data from (yesterday, or Friday if today is Monday) was a holiday.
-    us_holidays = holidays.US(state='NY') # APPROXIMATION for NYSE holidays
-    
-    # Find previous weekday
-    offset = 1
-    while True:
-        prev_date = today - timedelta(days=offset)
-        if prev_date.weekday() < 5: # Mon-Fri
-            break
-        offset += 1
-        
-    is_us_holiday_prev_close = prev_date in us_holidays
-    holiday_name_us = us_holidays.get(prev_date) if is_us_holiday_prev_close else None
+    # Previous weekday: Monday and Sunday step back to Friday, Saturday lands on Friday too.
+    offset = {0: 3, 6: 2}.get(today.weekday(), 1)
+    prev_date = today - timedelta(days=offset)
+
+    is_us_holiday_prev_close = prev_date in US_MARKET_HOLIDAYS
+    holiday_name_us = US_MARKET_HOLIDAYS.get(prev_date) if is_us_holiday_prev_close else None
             
     return is_kr_holiday, is_us_holiday_prev_close, holiday_name_kr, holiday_name_us
 
@@ -61,6 +72,78 @@ HEADERS = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 }
 
+
+# Optional on-disk HTTP cache (HTTP_CACHE_ENABLED) for same-day reruns.
+# Only Google News searches are cached. Everything else bypasses the cache:
+# article pages are streamed with a byte cap and non-HTML skip that a cached
+# response would defeat (requests-cache reads the whole body to store it),
+# and polled bond sources and Telegram must always hit the network.
+HTTP_CACHE_URL_EXPIRATIONS = {
+    "news.google.com/rss/search": 10 * 60,
+}
+DEFAULT_HTTP_CACHE_FILE = ".http_cache.sqlite"
+HTTP_RETRY_AFTER_MAX_SECONDS = 30
+
+
+class CappedRetry(Retry):
+    """
+    Honours a Retry-After header on 429/503 but never sleeps longer than
+    HTTP_RETRY_AFTER_MAX_SECONDS, so one slow host cannot stall the run.
+    """
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, HTTP_RETRY_AFTER_MAX_SECONDS)
+
+
+def build_http_session(cache_path=None):
+    """
+    Shared session so repeated requests to the same host (Google News, Telegram)
+    reuse pooled keep-alive connections instead of a new TCP+TLS handshake each time.
+    """
+    if cache_path:
+        import requests_cache
+
+        session = requests_cache.CachedSession(
+            cache_path,
+            backend="sqlite",
+            expire_after=requests_cache.DO_NOT_CACHE,
+            urls_expire_after=HTTP_CACHE_URL_EXPIRATIONS,
+        )
+    else:
+        session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=20,
+        max_retries=CappedRetry(
+            total=2,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            respect_retry_after_header=True,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+HTTP_SESSION = build_http_session()
+
+
+def configure_http_cache():
+    global HTTP_SESSION
+
+    if LOCAL_CACHES_BYPASSED or not parse_bool_env("HTTP_CACHE_ENABLED", False):
+        return False
+
+    cache_path = os.getenv("HTTP_CACHE_FILE", DEFAULT_HTTP_CACHE_FILE).strip()
+    HTTP_SESSION = build_http_session(cache_path=cache_path)
+    logging.info(f"   [HTTP Cache] Enabled for Google News searches: {cache_path}")
+    return True
+
 PEF_HARD_EXCLUDE_KEYWORDS = [
     "태풍", "강풍", "폭우", "산불", "지진", "홍수", "한파", "폭염",
     "연예", "가수", "배우", "콘서트", "축제", "경기 결과", "야구", "축구",
@@ -134,16 +217,35 @@ FIRM_SHORT_NAME_CONTEXT_KEYWORDS = [
 ]
 
 TELEGRAM_MESSAGE_LIMIT = 3900
+TELEGRAM_RATE_LIMIT_RETRIES = 2
+TELEGRAM_RETRY_AFTER_MAX_SECONDS = 60
+DEFAULT_ARTICLE_MAX_DOWNLOAD_BYTES = 64 * 1024
+ARTICLE_NOISE_XPATH = "//script|//style|//nav|//footer|//header|//comment()"
+ARTICLE_LINE_BREAK_RE = re.compile(r"\s*(?:[\n\r\v\f\x1c-\x1e\x85\u2028\u2029]| {2})\s*")
 PEF_FIRM_MENTION_MAX_ARTICLES = 5
 DEFAULT_PEF_WATCHLIST_FILE = "pef_watchlist.json"
 DEFAULT_NEWS_HISTORY_FILE = ".news_history.json"
 DEFAULT_NEWS_HISTORY_RETENTION_DAYS = 30
 DEFAULT_NEWS_HISTORY_TITLE_MATCH_DAYS = 7
+DEFAULT_NEWS_FETCH_MAX_WORKERS = 5
+RSS_SUMMARY_MIN_CHARS = 200
+RSS_SUMMARY_CHROME_TAGS = ["a", "font", "ol", "ul", "li"]
+GOOGLE_NEWS_RSS_URL = "https://news.google.com/rss/search"
+GOOGLE_NEWS_RSS_PARAMS = {"hl": "ko", "gl": "KR", "ceid": "KR:ko"}
 DEFAULT_GEMINI_MODELS = (
     "gemini-3.6-flash",
     "gemini-3.5-flash",
     "gemini-3.5-flash-lite",
 )
+DEFAULT_GEMINI_TIMEOUT_SECONDS = 90
+GEMINI_MAX_RETRY_DELAY_SECONDS = 120
+GEMINI_RETRY_INFO_DELAY_RE = re.compile(r"retryDelay['\"]?\s*:\s*['\"]?(\d+(?:\.\d+)?)s")
+DEFAULT_GEMINI_CACHE_FILE = ".gemini_cache.sqlite"
+DEFAULT_GEMINI_CACHE_TTL_SECONDS = 6 * 60 * 60
+DEFAULT_MARKET_CACHE_DIR = ".market_cache"
+DEFAULT_MARKET_CACHE_TTL_SECONDS = 30 * 60
+# Set by --no-cache: the HTTP, Gemini and market caches are all skipped for the run.
+LOCAL_CACHES_BYPASSED = False
 
 DART_DEBT_LIST_URL = "https://dart.fss.or.kr/dsac005/search.ax"
 DART_REPORT_URL = "https://dart.fss.or.kr/dsaf001/main.do"
@@ -202,6 +304,10 @@ KOREAN_PARTICLE_SUFFIXES = (
     "이", "가", "을", "를", "의", "에", "와", "과", "도",
 )
 
+# Punctuation and spaces to drop from in-run title fingerprints. Decimal points,
+# thousands separators and percent signs attached to digits are kept, so
+# "1.2조" and "12조" (or "3.5%" and "35%") stay different stories.
+TITLE_FINGERPRINT_STRIP_RE = re.compile(r"[^\w.,%]+|_+|(?<!\d)[.,%]+|[.,]+(?!\d)")
 EVENT_TITLE_STOPWORDS = {
     "관련", "대한", "통해", "위해", "추진", "계획", "전망", "가능성", "논란",
     "단독", "속보", "종합", "포토", "영상", "기자", "오늘", "이번", "최근",
@@ -210,12 +316,43 @@ EVENT_TITLE_STOPWORDS = {
 
 
 # --- Logging Configuration ---
+LOG_QUEUE_LISTENER = None
+LOG_FILE_FORMATTER = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+LOG_CONSOLE_FORMATTER = logging.Formatter('%(message)s') # Keep console clean
+
+
+def stop_log_queue_listener():
+    """
+    Drain queued records and close the file/console handlers.
+    """
+    global LOG_QUEUE_LISTENER
+
+    if LOG_QUEUE_LISTENER is None:
+        return
+    LOG_QUEUE_LISTENER.stop()
+    for handler in LOG_QUEUE_LISTENER.handlers:
+        handler.close()
+    LOG_QUEUE_LISTENER = None
+
+
+atexit.register(stop_log_queue_listener)
+
+
 def setup_logging():
+    global LOG_QUEUE_LISTENER
+
     # Create a custom logger
     logger = logging.getLogger()
     logger.setLevel(logging.INFO)
+
+    # Already configured: keep the running listener and its open log file.
+    if LOG_QUEUE_LISTENER is not None and any(
+        isinstance(handler, logging.handlers.QueueHandler) for handler in logger.handlers
+    ):
+        return
     
     # Remove existing handlers if any
+    stop_log_queue_listener()
     if logger.hasHandlers():
         logger.handlers.clear()
 
@@ -223,16 +360,21 @@ def setup_logging():
     log_file_path = os.getenv("LOG_FILE_PATH", "latest_run.log")
     file_handler = logging.FileHandler(log_file_path, mode='w', encoding='utf-8')
     file_handler.setLevel(logging.INFO)
-    file_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-    file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+    file_handler.setFormatter(LOG_FILE_FORMATTER)
     
     # Console Handler - Writes to stdout
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
-    console_formatter = logging.Formatter('%(message)s') # Keep console clean
-    console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+    console_handler.setFormatter(LOG_CONSOLE_FORMATTER)
+
+    # Callers (including the fetch worker threads) only enqueue records; a
+    # background listener does the file and stdout writes.
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    LOG_QUEUE_LISTENER = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    LOG_QUEUE_LISTENER.start()
 
 
 def normalize_text(*parts):
@@ -474,6 +616,45 @@ def get_news_fetch_settings(mode="weekday", reference_date=None):
     }
 
 
+# (mode, is_kr_holiday, is_us_holiday) -> (log label, RSS queries)
+NEWS_QUERY_PLANS = {
+    ("saturday", False, False): (
+        "Saturday: Focusing on US Market Close & Global News",
+        ("미국 증시 마감", "주간 해외 증시", "글로벌 경제뉴스"),
+    ),
+    ("sunday", False, False): (
+        "Sunday: Focusing on Weekly Summary & Next Week Outlook",
+        ("주간 증시 정리", "다음주 증시 일정", "다음주 경제 캘린더", "주간 증시 전망"),
+    ),
+    ("weekday", True, True): (
+        "Weekday (KR & US Holiday): Focusing on Global Economy",
+        ("글로벌 경제뉴스", "해외 증시 요약", "미국 경제 뉴스"),
+    ),
+    ("weekday", True, False): (
+        "Weekday (KR Holiday): Focusing on US Market & Global News",
+        ("미국 증시 마감", "글로벌 경제뉴스", "주요 해외 뉴스"),
+    ),
+    ("weekday", False, True): (
+        "Weekday (US Holiday): Focusing on General US Economy",
+        ("미국 경제 뉴스", "특징주", "국내 증시 전망"),
+    ),
+    ("weekday", False, False): (
+        "Weekday: Focusing on Daily Market Outlook",
+        ("미국 증시 마감", "특징주", "국내 증시 전망"),
+    ),
+}
+MONDAY_CATCH_UP_QUERIES = ("주말 글로벌 경제 뉴스", "이번주 증시 일정", "이번주 경제 캘린더")
+PEF_NEWS_QUERIES = (
+    "사모펀드",
+    "PEF M&A",
+    "PEF 투자 규제",
+    "사모펀드 운용사 GP",
+    "M&A 인수합병",
+    "경영권 매각",
+    "인수금융 리파이낸싱",
+)
+
+
 def build_news_queries(
     mode="weekday",
     is_us_holiday=False,
@@ -483,45 +664,21 @@ def build_news_queries(
 ):
     reference_date = reference_date or datetime.now().date()
 
-    if mode == "saturday":
-        logging.info("   [Mode] Saturday: Focusing on US Market Close & Global News")
-        queries = ["미국 증시 마감", "주간 해외 증시", "글로벌 경제뉴스"]
-    elif mode == "sunday":
-        logging.info("   [Mode] Sunday: Focusing on Weekly Summary & Next Week Outlook")
-        queries = ["주간 증시 정리", "다음주 증시 일정", "다음주 경제 캘린더", "주간 증시 전망"]
-    elif is_kr_holiday:
-        if is_us_holiday:
-            logging.info("   [Mode] Weekday (KR & US Holiday): Focusing on Global Economy")
-            queries = ["글로벌 경제뉴스", "해외 증시 요약", "미국 경제 뉴스"]
-        else:
-            logging.info("   [Mode] Weekday (KR Holiday): Focusing on US Market & Global News")
-            queries = ["미국 증시 마감", "글로벌 경제뉴스", "주요 해외 뉴스"]
-    elif is_us_holiday:
-        logging.info("   [Mode] Weekday (US Holiday): Focusing on General US Economy")
-        queries = ["미국 경제 뉴스", "특징주", "국내 증시 전망"]
+    if mode in {"saturday", "sunday"}:
+        plan_key = (mode, False, False)
     else:
-        logging.info("   [Mode] Weekday: Focusing on Daily Market Outlook")
-        queries = ["미국 증시 마감", "특징주", "국내 증시 전망"]
+        plan_key = ("weekday", bool(is_kr_holiday), bool(is_us_holiday))
+    mode_label, plan_queries = NEWS_QUERY_PLANS[plan_key]
+    logging.info(f"   [Mode] {mode_label}")
+    queries = list(plan_queries)
 
     if mode == "weekday" and reference_date.weekday() == 0 and target == "general":
         logging.info("   [Mode] Monday catch-up: Adding weekend news and this-week schedules")
-        queries.extend([
-            "주말 글로벌 경제 뉴스",
-            "이번주 증시 일정",
-            "이번주 경제 캘린더",
-        ])
+        queries.extend(MONDAY_CATCH_UP_QUERIES)
 
     if target == "pef":
         logging.info("   [Target] PEF: Using dedicated M&A and Private Equity queries")
-        queries = [
-            "사모펀드",
-            "PEF M&A",
-            "PEF 투자 규제",
-            "사모펀드 운용사 GP",
-            "M&A 인수합병",
-            "경영권 매각",
-            "인수금융 리파이낸싱",
-        ]
+        queries = list(PEF_NEWS_QUERIES)
 
     return list(dict.fromkeys(queries))
 
@@ -572,12 +729,104 @@ def get_gemini_models():
     return list(DEFAULT_GEMINI_MODELS)
 
 
+@lru_cache(maxsize=4)
+def get_gemini_client(api_key):
+    """
+    One client per API key, so the general and PEF briefings share its HTTP pool.
+    """
+    from google import genai
+
+    return genai.Client(api_key=api_key)
+
+
+@lru_cache(maxsize=8)
+def get_gemini_generate_config(system_instruction, timeout_seconds):
+    """
+    Request config per (system instruction, timeout); the pydantic model is
+    validated once and reused by every model and attempt in the fallback chain.
+    """
+    from google.genai import types as genai_types
+
+    return genai_types.GenerateContentConfig(
+        system_instruction=system_instruction,
+        # A hung model call should fail over to the next model, not stall the run.
+        http_options=genai_types.HttpOptions(timeout=timeout_seconds * 1000) if timeout_seconds else None,
+    )
+
+
+def get_gemini_cache_settings():
+    if LOCAL_CACHES_BYPASSED or not parse_bool_env("GEMINI_CACHE_ENABLED", False):
+        return None
+    return {
+        "path": os.getenv("GEMINI_CACHE_FILE", DEFAULT_GEMINI_CACHE_FILE).strip(),
+        "ttl_seconds": max(0, parse_int_env("GEMINI_CACHE_TTL_SECONDS", DEFAULT_GEMINI_CACHE_TTL_SECONDS)),
+    }
+
+
+def build_gemini_cache_key(model_name, prompt):
+    return hashlib.sha256(f"{model_name}\n{prompt}".encode("utf-8")).hexdigest()
+
+
+def open_gemini_cache(path):
+    connection = sqlite3.connect(path)
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS briefings (key TEXT PRIMARY KEY, text TEXT NOT NULL, ts INTEGER NOT NULL)"
+    )
+    return connection
+
+
+def load_cached_briefing(settings, key, now=None):
+    current_time = int(now if now is not None else time.time())
+    try:
+        with closing(open_gemini_cache(settings["path"])) as connection:
+            row = connection.execute(
+                "SELECT text, ts FROM briefings WHERE key = ?", (key,)
+            ).fetchone()
+    except sqlite3.Error as e:
+        logging.warning(f"   [Gemini Cache] Could not read {settings['path']}: {e}")
+        return None
+
+    if not row or current_time - row[1] > settings["ttl_seconds"]:
+        return None
+    return row[0]
+
+
+def store_cached_briefing(settings, key, text, now=None):
+    current_time = int(now if now is not None else time.time())
+    try:
+        with closing(open_gemini_cache(settings["path"])) as connection:
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO briefings (key, text, ts) VALUES (?, ?, ?)",
+                    (key, text, current_time),
+                )
+                connection.execute(
+                    "DELETE FROM briefings WHERE ts < ?",
+                    (current_time - settings["ttl_seconds"],),
+                )
+    except sqlite3.Error as e:
+        logging.warning(f"   [Gemini Cache] Could not write {settings['path']}: {e}")
+
+
 def is_rate_limit_error(error):
     status_code = getattr(error, "status_code", None) or getattr(error, "code", None)
     message = str(error).lower()
     return status_code == 429 or "429" in message or "resource_exhausted" in message
 
 
+def get_gemini_retry_delay(error, retry_delay, attempt):
+    """
+    Use the RetryInfo delay Gemini attaches to 429s when present; otherwise back
+    off exponentially with jitter. Either way the wait is capped.
+    """
+    match = GEMINI_RETRY_INFO_DELAY_RE.search(str(error))
+    if match:
+        delay = float(match.group(1))
+    else:
+        delay = retry_delay * 2 ** attempt + random.uniform(0, retry_delay)
+    return min(delay, GEMINI_MAX_RETRY_DELAY_SECONDS)
+
+
 def briefing_generation_succeeded(briefing):
     return bool(briefing and not briefing.lstrip().lower().startswith("error:"))
 
@@ -625,11 +874,79 @@ def match_firm_mention(searchable_text, match_terms, firm_name):
     return False, "firm name not found in title/content"
 
 
+GOOGLE_NEWS_ARTICLE_PATH_RE = re.compile(r"^/rss/articles/([A-Za-z0-9_-]+)")
+TRACKING_QUERY_PARAM_RE = re.compile(r"^(?:utm_\w+|fbclid|gclid|oc)$", re.IGNORECASE)
+
+
+def decode_google_news_link(url):
+    """
+    Best-effort extraction of the publisher URL embedded in a Google News
+    /rss/articles/<id> link. Returns None when the id carries no plain URL.
+    """
+    parts = urlsplit(url or "")
+    match = GOOGLE_NEWS_ARTICLE_PATH_RE.match(parts.path)
+    if parts.netloc != "news.google.com" or not match:
+        return None
+
+    article_id = match.group(1)
+    try:
+        payload = base64.urlsafe_b64decode(article_id + "=" * (-len(article_id) % 4))
+    except (ValueError, binascii.Error):
+        return None
+
+    start = payload.find(b"http")
+    if start <= 0:
+        return None
+    # The URL is a length-prefixed protobuf string; read the 1-2 byte varint length.
+    if start >= 2 and payload[start - 2] & 0x80:
+        length = (payload[start - 2] & 0x7F) | (payload[start - 1] << 7)
+    else:
+        length = payload[start - 1]
+    candidate = payload[start:start + length]
+    if len(candidate) != length or not re.fullmatch(rb"https?://[\x21-\x7e]+", candidate):
+        return None
+    return candidate.decode("ascii")
+
+
+def get_article_fetch_url(link):
+    return decode_google_news_link(link) or link
+
+
+def normalize_news_link(link):
+    """
+    Dedupe key for an article link: the publisher URL when it can be recovered,
+    without tracking parameters, fragment, host case, or trailing slash.
+    Other query parameters are kept because many Korean news sites identify
+    articles by them (e.g. ?idxno=).
+    """
+    parts = urlsplit(get_article_fetch_url((link or "").strip()))
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not TRACKING_QUERY_PARAM_RE.match(key)
+    ]
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path.rstrip("/"),
+        urlencode(query),
+        "",
+    ))
+
+
 def normalize_title_for_dedupe(title):
     normalized = re.sub(r"\s+", " ", title or "").strip().lower()
     return re.sub(r"\s+-\s+[^-]+$", "", normalized)
 
 
+def compact_title_key(title_key):
+    """
+    In-run title fingerprint: the dedupe key with punctuation and spaces removed, so
+    "[속보] 코스피, 2% 상승" and "속보 코스피 2% 상승" from different queries match.
+    """
+    return TITLE_FINGERPRINT_STRIP_RE.sub("", title_key)
+
+
 def get_event_title_tokens(title):
     normalized = normalize_title_for_dedupe(title)
     tokens = []
@@ -877,7 +1194,7 @@ def save_news_history(history):
 def should_skip_seen_article(entry, history, target="general", seen_title_keys=None):
     if not history:
         title_key = normalize_title_for_dedupe(entry.title)
-        if seen_title_keys is not None and title_key in seen_title_keys:
+        if seen_title_keys is not None and compact_title_key(title_key) in seen_title_keys:
             return True, "title_in_run", title_key
         return False, None, title_key
 
@@ -897,7 +1214,7 @@ def should_skip_seen_article(entry, history, target="general", seen_title_keys=N
     )
     if duplicate_title:
         return True, "same_event", title_key
-    if seen_title_keys is not None and title_key in seen_title_keys:
+    if seen_title_keys is not None and compact_title_key(title_key) in seen_title_keys:
         return True, "title_in_run", title_key
     return False, None, title_key
 
@@ -1012,6 +1329,27 @@ def sanitize_telegram_html(message):
     return re.sub(r"&(?!#?\w+;)", "&amp;", message)
 
 
+TELEGRAM_BLOCK_BREAK_TAG_RE = re.compile(r"<br\s*/?>|</(?:p|div|li|h[1-6])\s*>", re.IGNORECASE)
+TELEGRAM_LIST_ITEM_TAG_RE = re.compile(r"<li\b[^>]*>", re.IGNORECASE)
+TELEGRAM_FORBIDDEN_TAG_RE = re.compile(r"</?(?:p|ul|ol|li|div|span|font|br|h[1-6])\b[^>]*>", re.IGNORECASE)
+TELEGRAM_STRAY_LT_RE = re.compile(
+    r"<(?!/?(?:b|strong|i|em|u|ins|s|strike|del|a|code|pre|blockquote|tg-spoiler|tg-emoji)\b)",
+    re.IGNORECASE,
+)
+
+
+def strip_unsupported_telegram_tags(message):
+    """
+    Rewrite the tags the prompt forbids (but models still emit) so the HTML send
+    parses on the first attempt: breaks and block ends become newlines, list
+    items become hyphens, and any other unsupported "<" is escaped.
+    """
+    message = TELEGRAM_BLOCK_BREAK_TAG_RE.sub("\n", message)
+    message = TELEGRAM_LIST_ITEM_TAG_RE.sub("- ", message)
+    message = TELEGRAM_FORBIDDEN_TAG_RE.sub("", message)
+    return TELEGRAM_STRAY_LT_RE.sub("&lt;", message)
+
+
 def convert_html_to_plain_text(message):
     """
     Convert a Telegram HTML message into plain text while preserving links.
@@ -1035,6 +1373,24 @@ def convert_html_to_plain_text(message):
     return plain_message.strip()
 
 
+def get_telegram_retry_after(response):
+    """
+    Seconds Telegram asks us to wait on a 429 (parameters.retry_after, else the
+    Retry-After header), or None when the response is not a rate limit.
+    """
+    if response.status_code != 429:
+        return None
+    try:
+        retry_after = response.json()["parameters"]["retry_after"]
+    except (ValueError, KeyError, TypeError):
+        retry_after = response.headers.get("Retry-After")
+    try:
+        retry_after = int(retry_after)
+    except (TypeError, ValueError):
+        retry_after = 1
+    return min(max(1, retry_after), TELEGRAM_RETRY_AFTER_MAX_SECONDS)
+
+
 def send_telegram_chunks(url, chat_id, message, parse_mode=None):
     """
     Send one logical message to Telegram, splitting into multiple chunks if needed.
@@ -1055,7 +1411,15 @@ def send_telegram_chunks(url, chat_id, message, parse_mode=None):
             f"   Sending Telegram chunk {idx}/{total_chunks} "
             f"({len(chunk)} chars, mode={parse_mode or 'PLAIN'})..."
         )
-        response = requests.post(url, json=payload, timeout=15)
+        for attempt in range(TELEGRAM_RATE_LIMIT_RETRIES + 1):
+            response = HTTP_SESSION.post(url, json=payload, timeout=15)
+            retry_after = get_telegram_retry_after(response)
+            if retry_after is None or attempt == TELEGRAM_RATE_LIMIT_RETRIES:
+                break
+            logging.warning(
+                f"   [Telegram] Rate limited; retrying chunk {idx}/{total_chunks} in {retry_after}s."
+            )
+            time.sleep(retry_after)
         if response.ok:
             continue
 
@@ -1122,7 +1486,7 @@ def parse_disclosure_date(value):
 
 
 def parse_dart_debt_list(list_html):
-    soup = BeautifulSoup(list_html, "html.parser")
+    soup = BeautifulSoup(list_html, "lxml")
     disclosures = []
 
     for row in soup.select("table tbody tr"):
@@ -1351,11 +1715,11 @@ def extract_dart_bond_terms(overview_soup, payment_date):
 
 
 def parse_dart_bond_event(disclosure, overview_html, pricing_html=None):
-    overview_soup = BeautifulSoup(overview_html, "html.parser")
+    overview_soup = BeautifulSoup(overview_html, "lxml")
     overview_text = normalize_whitespace(overview_soup.get_text(" ", strip=True))
     pricing_text = ""
     if pricing_html:
-        pricing_soup = BeautifulSoup(pricing_html, "html.parser")
+        pricing_soup = BeautifulSoup(pricing_html, "lxml")
         pricing_text = normalize_whitespace(pricing_soup.get_text(" ", strip=True))
 
     demand_date, start_time, end_time = extract_dart_demand_schedule(
@@ -1425,12 +1789,40 @@ def get_dart_viewer_response(requester, section, timeout):
     return response.text
 
 
+def fetch_dart_bond_event(disclosure, requester, timeout):
+    report_response = requester.get(
+        disclosure["report_url"],
+        headers=HEADERS,
+        timeout=timeout,
+    )
+    report_response.raise_for_status()
+    sections = parse_dart_toc_sections(report_response.text)
+    overview_section = find_dart_toc_section(sections, "공모개요")
+    if not overview_section:
+        raise ValueError("공모개요 section not found")
+
+    overview_html = get_dart_viewer_response(requester, overview_section, timeout)
+    event = parse_dart_bond_event(disclosure, overview_html)
+
+    if event and not event.get("rate_band"):
+        pricing_section = find_dart_toc_section(sections, "공모가격 결정방법")
+        if pricing_section:
+            pricing_html = get_dart_viewer_response(requester, pricing_section, timeout)
+            event = parse_dart_bond_event(
+                disclosure,
+                overview_html,
+                pricing_html=pricing_html,
+            )
+    return event
+
+
 def fetch_dart_debt_disclosures(reference_date=None, requester=None):
-    requester = requester or requests
+    requester = requester or HTTP_SESSION
     reference_date = reference_date or datetime.now().date()
     timeout = max(3, parse_int_env("BOND_SOURCE_TIMEOUT_SECONDS", 15))
     lookahead_days = max(1, parse_int_env("BOND_DART_LOOKAHEAD_DAYS", 14))
     max_candidates = max(1, parse_int_env("BOND_DART_MAX_CANDIDATES", 16))
+    max_workers = max(1, parse_int_env("BOND_DART_MAX_WORKERS", 4))
     end_date = reference_date + timedelta(days=lookahead_days)
     result = {
         "source": "dart",
@@ -1504,49 +1896,24 @@ def fetch_dart_debt_disclosures(reference_date=None, requester=None):
     result["candidates"] = len(candidates)
 
     report_failures = 0
-    for disclosure in candidates:
-        try:
-            report_response = requester.get(
-                disclosure["report_url"],
-                headers=HEADERS,
-                timeout=timeout,
-            )
-            report_response.raise_for_status()
-            sections = parse_dart_toc_sections(report_response.text)
-            overview_section = find_dart_toc_section(sections, "공모개요")
-            if not overview_section:
-                raise ValueError("공모개요 section not found")
-
-            overview_html = get_dart_viewer_response(
-                requester,
-                overview_section,
-                timeout,
-            )
-            event = parse_dart_bond_event(disclosure, overview_html)
-
-            if event and not event.get("rate_band"):
-                pricing_section = find_dart_toc_section(sections, "공모가격 결정방법")
-                if pricing_section:
-                    pricing_html = get_dart_viewer_response(
-                        requester,
-                        pricing_section,
-                        timeout,
-                    )
-                    event = parse_dart_bond_event(
-                        disclosure,
-                        overview_html,
-                        pricing_html=pricing_html,
-                    )
-
-            if event and reference_date <= event["demand_date"] <= end_date:
-                result["items"].append(event)
-        except (requests.RequestException, ValueError, KeyError) as error:
-            report_failures += 1
-            result["errors"].append(f"{disclosure['issuer']}: {error}")
-            logging.warning(
-                f"   [Bond Market] DART report parse failed "
-                f"({disclosure['issuer']}): {error}"
-            )
+    max_workers = min(max_workers, len(candidates)) or 1
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(fetch_dart_bond_event, disclosure, requester, timeout)
+            for disclosure in candidates
+        ]
+        for disclosure, future in zip(candidates, futures):
+            try:
+                event = future.result()
+                if event and reference_date <= event["demand_date"] <= end_date:
+                    result["items"].append(event)
+            except (requests.RequestException, ValueError, KeyError) as error:
+                report_failures += 1
+                result["errors"].append(f"{disclosure['issuer']}: {error}")
+                logging.warning(
+                    f"   [Bond Market] DART report parse failed "
+                    f"({disclosure['issuer']}): {error}"
+                )
 
     unique_events = {}
     for event in result["items"]:
@@ -1760,7 +2127,7 @@ def extract_nh_syndication_pdf(pdf_content):
 
 
 def fetch_nh_syndication_schedule(reference_date=None, requester=None):
-    requester = requester or requests
+    requester = requester or HTTP_SESSION
     reference_date = reference_date or datetime.now().date()
     timeout = max(15, parse_int_env("NH_PDF_TIMEOUT_SECONDS", 90))
     lookback_days = max(0, parse_int_env("NH_PDF_LOOKBACK_DAYS", 3))
@@ -2060,7 +2427,7 @@ def aggregate_kofia_pending(records):
 
 
 def fetch_kofia_bond_issuance(reference_date=None, requester=None):
-    requester = requester or requests
+    requester = requester or HTTP_SESSION
     reference_date = reference_date or datetime.now().date()
     timeout = max(3, parse_int_env("BOND_SOURCE_TIMEOUT_SECONDS", 15))
     result = {
@@ -2181,44 +2548,48 @@ def fetch_bond_market_data(
         and deadline is not None
     )
 
-    dart_result = dart_fetcher(reference_date)
     attempts = 0
     deadline_reached = False
 
-    while True:
-        attempts += 1
-        kofia_result = kofia_fetcher(reference_date)
-        nh_result = nh_fetcher(reference_date)
-        current_time = now_provider()
-        ready = bond_sources_ready(kofia_result, nh_result, reference_date)
-        logging.info(
-            f"   [Bond Market] Attempt {attempts}: "
-            f"DART={dart_result['status']} "
-            f"({len(dart_result['items'])} demand schedule(s)), "
-            f"KOFIA={kofia_result['status']} "
-            f"({len(kofia_result['items'])} confirmed, "
-            f"{len(kofia_result.get('pending_items', []))} amount-pending), "
-            f"NH={nh_result['status']} "
-            f"({len(nh_result['items'])} planned schedule(s))."
-        )
-        if ready or not polling_allowed:
-            break
-
-        remaining_seconds = (deadline - current_time).total_seconds()
-        if remaining_seconds <= 0:
-            deadline_reached = True
-            logging.warning(
-                f"   [Bond Market] Sources still incomplete at "
-                f"{deadline.strftime('%H:%M')}; using the latest available data."
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        # DART is read once; KOFIA/NH are re-polled, each round in parallel.
+        dart_future = executor.submit(dart_fetcher, reference_date)
+        while True:
+            attempts += 1
+            kofia_future = executor.submit(kofia_fetcher, reference_date)
+            nh_result = nh_fetcher(reference_date)
+            kofia_result = kofia_future.result()
+            dart_result = dart_future.result()
+            current_time = now_provider()
+            ready = bond_sources_ready(kofia_result, nh_result, reference_date)
+            logging.info(
+                f"   [Bond Market] Attempt {attempts}: "
+                f"DART={dart_result['status']} "
+                f"({len(dart_result['items'])} demand schedule(s)), "
+                f"KOFIA={kofia_result['status']} "
+                f"({len(kofia_result['items'])} confirmed, "
+                f"{len(kofia_result.get('pending_items', []))} amount-pending), "
+                f"NH={nh_result['status']} "
+                f"({len(nh_result['items'])} planned schedule(s))."
             )
-            break
+            if ready or not polling_allowed:
+                break
 
-        wait_seconds = min(interval_seconds, max(1, int(remaining_seconds)))
-        logging.info(
-            f"   [Bond Market] Sources not ready; retrying in "
-            f"{wait_seconds} second(s), no later than {deadline.strftime('%H:%M')}."
-        )
-        sleeper(wait_seconds)
+            remaining_seconds = (deadline - current_time).total_seconds()
+            if remaining_seconds <= 0:
+                deadline_reached = True
+                logging.warning(
+                    f"   [Bond Market] Sources still incomplete at "
+                    f"{deadline.strftime('%H:%M')}; using the latest available data."
+                )
+                break
+
+            wait_seconds = min(interval_seconds, max(1, int(remaining_seconds)))
+            logging.info(
+                f"   [Bond Market] Sources not ready; retrying in "
+                f"{wait_seconds} second(s), no later than {deadline.strftime('%H:%M')}."
+            )
+            sleeper(wait_seconds)
 
     return {
         "enabled": True,
@@ -2579,60 +2950,267 @@ def calculate_market_performance(history, mode="weekday"):
     }
 
 
+MARKET_TICKERS = {
+    "KOSPI": "^KS11",
+    "KOSDAQ": "^KQ11",
+    "S&P 500": "^GSPC",
+    "NASDAQ": "^IXIC",
+    "DOW JONES": "^DJI",
+    "RUSSELL 2000": "^RUT",
+    "PHILLY SEMI": "^SOX", # Philadelphia Semiconductor
+    "USD/KRW": "KRW=X",
+    "BTC/USD": "BTC-USD"
+}
+
+
+def get_market_history_period(mode="weekday"):
+    # Daily mode only needs two valid closes per symbol, but KR, US and crypto
+    # trade on different calendars; 5 days still covers a holiday on either side.
+    return "1mo" if mode in {"saturday", "sunday"} else "5d"
+
+
+# Only Close is read, so skip the adjustment pass, dividend/split columns and
+# pre/post-market bars.
+MARKET_HISTORY_OPTIONS = {
+    "interval": "1d",
+    "auto_adjust": False,
+    "actions": False,
+    "prepost": False,
+}
+
+
+def fetch_ticker_performance(name, symbol, mode="weekday"):
+    import yfinance as yf
+
+    try:
+        history = yf.Ticker(symbol).history(
+            period=get_market_history_period(mode),
+            **MARKET_HISTORY_OPTIONS,
+        )
+        return name, calculate_market_performance(history, mode=mode)
+    except Exception as e:
+        logging.error(f"   Error fetching {name}: {e}")
+        return name, None
+
+
+def fetch_market_data_per_ticker(mode="weekday", tickers=None):
+    """
+    Fallback path: requests each ticker's history concurrently.
+    """
+    tickers = MARKET_TICKERS if tickers is None else tickers
+    results = {}
+    if not tickers:
+        return results
+
+    with ThreadPoolExecutor(max_workers=len(tickers)) as executor:
+        futures = [
+            executor.submit(fetch_ticker_performance, name, symbol, mode)
+            for name, symbol in tickers.items()
+        ]
+        for future in as_completed(futures):
+            name, performance = future.result()
+            results[name] = performance
+
+    # Keep the display order stable regardless of completion order.
+    return {name: results.get(name) for name in tickers}
+
+
 def fetch_market_data(mode="weekday"):
     """
     Fetches key market indices and exchange rates, including Philly Semi and Russell 2000.
+    All tickers are downloaded in one batch; per-ticker requests are only used if it fails
+    or leaves individual symbols without data.
     """
-    tickers = {
-        "KOSPI": "^KS11",
-        "KOSDAQ": "^KQ11",
-        "S&P 500": "^GSPC",
-        "NASDAQ": "^IXIC",
-        "DOW JONES": "^DJI",
-        "RUSSELL 2000": "^RUT",
-        "PHILLY SEMI": "^SOX", # Philadelphia Semiconductor
-        "USD/KRW": "KRW=X",
-        "BTC/USD": "BTC-USD"
-    }
-    
-    data = {}
+    # yfinance and google-genai are imported on first use; together they add
+    # over a second of startup time to runs that never reach them.
+    import yfinance as yf
+
     logging.info("   Fetching market data...")
-    
-    for name, symbol in tickers.items():
+
+    try:
+        histories = yf.download(
+            list(MARKET_TICKERS.values()),
+            period=get_market_history_period(mode),
+            group_by="ticker",
+            **MARKET_HISTORY_OPTIONS,
+            threads=True,
+            progress=False,
+        )
+        if histories is None or histories.empty:
+            raise ValueError("batch download returned no data")
+
+        downloaded_symbols = set(histories.columns.get_level_values(0))
+        daily_performance = {}
+        if mode not in {"saturday", "sunday"}:
+            daily_performance = calculate_daily_performance_batch(
+                histories.xs("Close", axis=1, level=1)
+            )
+    except Exception as e:
+        logging.warning(f"   Batch market download failed ({e}); fetching tickers individually.")
+        return fetch_market_data_per_ticker(mode=mode)
+
+    data = {}
+    for name, symbol in MARKET_TICKERS.items():
         try:
-            ticker = yf.Ticker(symbol)
-            history = ticker.history(period="1mo" if mode in {"saturday", "sunday"} else "5d")
-            data[name] = calculate_market_performance(history, mode=mode)
+            if symbol not in downloaded_symbols:
+                data[name] = None
+            elif mode in {"saturday", "sunday"}:
+                data[name] = calculate_market_performance(histories[symbol], mode=mode)
+            else:
+                data[name] = daily_performance.get(symbol)
         except Exception as e:
-            logging.error(f"   Error fetching {name}: {e}")
+            logging.error(f"   Error reading {name} from batch download: {e}")
             data[name] = None
-            
+
+    # A symbol that the batch dropped or returned without closes gets one
+    # individual retry, so a single bad ticker does not blank out its row.
+    missing = {name: MARKET_TICKERS[name] for name, performance in data.items() if performance is None}
+    if missing:
+        logging.warning(
+            f"   Batch market download had no data for {', '.join(missing)}; retrying individually."
+        )
+        data.update(fetch_market_data_per_ticker(mode=mode, tickers=missing))
+    return data
+
+
+def get_market_cache_path(reference_date, mode):
+    if LOCAL_CACHES_BYPASSED or not parse_bool_env("MARKET_CACHE_ENABLED", False):
+        return None
+    cache_dir = os.getenv("MARKET_CACHE_DIR", DEFAULT_MARKET_CACHE_DIR).strip()
+    return os.path.join(cache_dir, f"market_{reference_date.isoformat()}_{mode}.json")
+
+
+def load_cached_market_data(path, now=None):
+    ttl_seconds = max(0, parse_int_env("MARKET_CACHE_TTL_SECONDS", DEFAULT_MARKET_CACHE_TTL_SECONDS))
+    current_time = now if now is not None else time.time()
+    try:
+        if current_time - os.path.getmtime(path) > ttl_seconds:
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logging.warning(f"   [Market Cache] Could not read {path}: {e}")
+        return None
+
+
+def store_cached_market_data(path, data):
+    temp_path = f"{path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+    except (OSError, TypeError, ValueError) as e:
+        logging.warning(f"   [Market Cache] Could not write {path}: {e}")
+
+
+def fetch_market_data_cached(mode="weekday", reference_date=None):
+    """
+    fetch_market_data with an opt-in file cache per (date, mode), so reruns of the
+    same day (test iterations, retries after a delivery failure) skip yfinance.
+    """
+    reference_date = reference_date or datetime.now().date()
+    cache_path = get_market_cache_path(reference_date, mode)
+    if cache_path:
+        cached = load_cached_market_data(cache_path)
+        if cached is not None:
+            logging.info(f"   [Market Cache] Reusing market data from {cache_path}")
+            return cached
+
+    data = fetch_market_data(mode=mode)
+    # Only complete snapshots are cached; a partial one should be refetched.
+    if cache_path and all(performance is not None for performance in data.values()):
+        store_cached_market_data(cache_path, data)
     return data
 
+
+def calculate_daily_performance_batch(closes):
+    """
+    Vectorized daily version of calculate_market_performance for a frame of
+    closes with one column per symbol. Markets trade on different calendars,
+    so each column's last two *valid* closes are used rather than the last two rows.
+    """
+    valid = closes.notna()
+    # Number of valid closes at or after each row: 1 marks the latest, 2 the previous.
+    remaining = valid[::-1].cumsum()[::-1]
+    latest = closes.where(valid & (remaining == 1)).max()
+    previous = closes.where(valid & (remaining == 2)).max()
+    previous = previous.fillna(latest)
+
+    change = latest - previous
+    pct_change = ((change / previous.where(previous != 0)) * 100).fillna(0.0)
+    missing = latest.isna()
+
+    performance = {}
+    for symbol in closes.columns:
+        if missing[symbol]:
+            performance[symbol] = None
+            continue
+        performance[symbol] = {
+            "price": latest[symbol],
+            "change": change[symbol],
+            "pct_change": pct_change[symbol],
+            "period": "daily",
+        }
+    return performance
+
+
+def extract_article_text(content, encoding=None):
+    """
+    Extract readable text from raw article HTML using lxml's tree directly.
+    """
+    parser = lxml_html.HTMLParser(encoding=encoding)
+    tree = lxml_html.fromstring(content, parser=parser)
+
+    # Empty script/style blocks, page chrome, and comments; tail text stays separate.
+    for element in tree.xpath(ARTICLE_NOISE_XPATH):
+        element.clear(keep_tail=True)
+
+    text = "\n".join(tree.itertext())
+
+    # One line per text chunk: any whitespace run containing a line break or a
+    # double space (multi-headlines) collapses to a single newline.
+    return ARTICLE_LINE_BREAK_RE.sub("\n", text).strip()
+
+
+def get_article_max_download_bytes():
+    return max(8192, parse_int_env("ARTICLE_MAX_DOWNLOAD_BYTES", DEFAULT_ARTICLE_MAX_DOWNLOAD_BYTES))
+
+
+def read_response_prefix(response, max_bytes, chunk_size=8192):
+    buffer = bytearray()
+    for chunk in response.iter_content(chunk_size):
+        buffer.extend(chunk)
+        if len(buffer) >= max_bytes:
+            break
+    return bytes(buffer[:max_bytes])
+
+
 def scrape_article_content(url):
     """
     Fetches and extracts the main text content from a news article URL.
     """
     try:
         # Google News links are often redirects, requests usually handles them but let's be safe
-        response = requests.get(url, headers=HEADERS, timeout=5)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Remove script and style elements
-        for script in soup(["script", "style", "nav", "footer", "header"]):
-            script.decompose()
-            
-        # Get text
-        text = soup.get_text(separator='\n')
-        
-        # Break into lines and remove leading/trailing space on each
-        lines = (line.strip() for line in text.splitlines())
-        # Break multi-headlines into a line each
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        # Drop blank lines
-        text = '\n'.join(chunk for chunk in chunks if chunk)
+        # Only the first 800 chars of text are kept, so stream and stop after a
+        # bounded prefix instead of downloading the whole page.
+        response = HTTP_SESSION.get(url, timeout=5, stream=True)
+        try:
+            response.raise_for_status()
+            content_type = response.headers.get("Content-Type", "").lower()
+            # PDFs, images and other binaries have no article text worth downloading.
+            if content_type and "html" not in content_type and "xml" not in content_type:
+                logging.info(f"   Skipping non-HTML article ({content_type}): {url}")
+                return None
+            content = read_response_prefix(response, get_article_max_download_bytes())
+        finally:
+            response.close()
+
+        # Use the server-declared charset when present; otherwise lxml reads the meta tag.
+        encoding = response.encoding if "charset=" in content_type else None
+        text = extract_article_text(content, encoding=encoding)
         
         # Limit text length to avoid token limits (approx 800 chars per article is usually enough for summary)
         return text[:800]
@@ -2642,17 +3220,150 @@ def scrape_article_content(url):
         return None
 
 
-def parse_google_news_feed(response):
-    response.raise_for_status()
-    feed = feedparser.parse(response.content)
-    if getattr(feed, "bozo", False) and not getattr(feed, "entries", []):
-        raise ValueError(f"invalid RSS response: {getattr(feed, 'bozo_exception', 'parse error')}")
-    return feed
+NewsFeed = namedtuple("NewsFeed", ["entries"])
+NewsFeedEntry = namedtuple("NewsFeedEntry", ["title", "link", "published", "summary"])
 
 
-def fetch_news(
-    mode="weekday",
-    is_us_holiday=False,
+def parse_google_news_feed(response, max_entries=None):
+    """
+    Stream <item> elements out of an RSS response and stop once max_entries
+    have been read, instead of building the whole feed document.
+    """
+    response.raise_for_status()
+    entries = []
+    try:
+        for _event, element in ET.iterparse(BytesIO(response.content), events=("end",)):
+            if element.tag != "item":
+                continue
+            entries.append(NewsFeedEntry(
+                title=(element.findtext("title") or "").strip(),
+                link=(element.findtext("link") or "").strip(),
+                published=(element.findtext("pubDate") or "Unknown").strip(),
+                summary=element.findtext("description") or "",
+            ))
+            element.clear()
+            if max_entries is not None and len(entries) >= max_entries:
+                break
+    except ET.ParseError as e:
+        if not entries:
+            raise ValueError(f"invalid RSS response: {e}") from e
+    return NewsFeed(entries=entries)
+
+
+@lru_cache(maxsize=256)
+def build_google_news_rss_url(rss_query):
+    """
+    Percent-encode the (usually Korean) search query once per distinct query.
+    """
+    return f"{GOOGLE_NEWS_RSS_URL}?{urlencode({'q': rss_query, **GOOGLE_NEWS_RSS_PARAMS}, quote_via=quote)}"
+
+
+def get_news_fetch_workers():
+    return max(1, parse_int_env("NEWS_FETCH_MAX_WORKERS", DEFAULT_NEWS_FETCH_MAX_WORKERS))
+
+
+def fetch_google_news_feed(rss_query, max_entries=None):
+    response = HTTP_SESSION.get(build_google_news_rss_url(rss_query), timeout=10)
+    return parse_google_news_feed(response, max_entries=max_entries)
+
+
+def fetch_google_news_feeds(rss_queries, max_entries=None):
+    """
+    Fetch several RSS searches concurrently.
+    Returns (feed, error) pairs in the same order as rss_queries.
+    """
+    if not rss_queries:
+        return []
+
+    results = []
+    max_workers = min(get_news_fetch_workers(), len(rss_queries))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(fetch_google_news_feed, query, max_entries)
+            for query in rss_queries
+        ]
+        for future in futures:
+            try:
+                results.append((future.result(), None))
+            except Exception as e:
+                results.append((None, e))
+    return results
+
+
+def scrape_articles(urls):
+    """
+    Scrape article bodies concurrently, preserving the order of urls.
+    """
+    if not urls:
+        return []
+
+    max_workers = min(get_news_fetch_workers(), len(urls))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(scrape_article_content, urls))
+
+
+def scrape_candidates_as_needed(candidates, slots_left, get_link=lambda entry: entry.link):
+    """
+    Yield (candidate, content) pairs in order, scraping concurrently in batches no
+    larger than slots_left(). Capped collectors then only fetch as many articles as
+    they can still accept, topping up with the next batch when some are rejected.
+    """
+    index = 0
+    while index < len(candidates):
+        batch_size = slots_left()
+        if batch_size <= 0:
+            return
+        batch = candidates[index:index + batch_size]
+        index += len(batch)
+        contents = scrape_articles([get_article_fetch_url(get_link(candidate)) for candidate in batch])
+        yield from zip(batch, contents)
+
+
+def extract_rss_summary_text(summary, title=None):
+    """
+    Visible summary text that is not just link chrome. Google News descriptions
+    are the headline link, a <font> publisher name and, for clustered stories,
+    an <ol> of related headlines; none of that is article body, so it is dropped
+    along with any repeat of the entry title.
+    """
+    if not summary:
+        return ""
+    soup = BeautifulSoup(summary, "lxml")
+    for element in soup.find_all(RSS_SUMMARY_CHROME_TAGS):
+        element.decompose()
+    text = normalize_whitespace(soup.get_text(" ", strip=True))
+    headline = normalize_whitespace((title or "").rsplit(" - ", 1)[0])
+    if headline:
+        text = normalize_whitespace(text.replace(headline, " "))
+    return text[:800]
+
+
+def collect_article_contents(entries, target="general"):
+    """
+    Use the RSS summary as the article text when it is long enough, and scrape
+    only the rest. FETCH_FULL_ARTICLES=true scrapes every article, and so does the
+    PEF target, whose filter scores keywords in the article body.
+    """
+    if target == "pef" or parse_bool_env("FETCH_FULL_ARTICLES", False):
+        return scrape_articles([get_article_fetch_url(entry.link) for entry in entries])
+
+    contents = [
+        extract_rss_summary_text(getattr(entry, "summary", ""), title=entry.title)
+        for entry in entries
+    ]
+    scrape_indexes = [
+        index for index, content in enumerate(contents)
+        if len(content) < RSS_SUMMARY_MIN_CHARS
+    ]
+    scraped = scrape_articles([get_article_fetch_url(entries[index].link) for index in scrape_indexes])
+    for index, content in zip(scrape_indexes, scraped):
+        contents[index] = content
+    return contents
+
+
+def fetch_news(
+    mode="weekday",
+    is_us_holiday=False,
     is_kr_holiday=False,
     target="general",
     initial_seen_links=None,
@@ -2680,97 +3391,95 @@ def fetch_news(
     )
     
     combined_news_context = ""
-    seen_links = set(initial_seen_links) if initial_seen_links else set()
+    seen_links = {normalize_news_link(link) for link in initial_seen_links or ()}
     seen_title_keys = set()
     accepted_event_titles = []
     collected_links = []
     pending_articles = []
+    candidates = []
     fetch_status = new_fetch_status(f"{target}_news")
     
     logging.info("   Fetching news and scraping content...")
-    
-    for query in queries:
-        time_restricted_query = f"{query} when:{lookback_days}d"
+
+    # RSS searches and article scrapes are network-bound, so both run concurrently.
+    # Dedupe and filtering stay sequential to keep the query order deterministic.
+    feed_results = fetch_google_news_feeds(
+        [f"{query} when:{lookback_days}d" for query in queries],
+        max_entries=max_entries_per_query,
+    )
+    for query, (feed, error) in zip(queries, feed_results):
         fetch_status["queries_attempted"] += 1
-        try:
-            response = requests.get(
-                "https://news.google.com/rss/search",
-                params={
-                    "q": time_restricted_query,
-                    "hl": "ko",
-                    "gl": "KR",
-                    "ceid": "KR:ko",
-                },
-                timeout=10,
+        if error is not None:
+            fetch_status["queries_failed"] += 1
+            fetch_status["errors"].append(f"{query}: {type(error).__name__}: {str(error)[:200]}")
+            logging.error(f"   Error fetching RSS for {query}: {error}")
+            continue
+
+        entries = list(feed.entries[:max_entries_per_query])
+        fetch_status["queries_succeeded"] += 1
+        fetch_status["entries_found"] += len(entries)
+
+        for entry in entries:
+            link_key = normalize_news_link(entry.link)
+            if link_key in seen_links:
+                continue
+            skip_article, skip_reason, title_key = should_skip_seen_article(
+                entry,
+                news_history,
+                target=target,
+                seen_title_keys=seen_title_keys
             )
-            feed = parse_google_news_feed(response)
-            entries = list(feed.entries[:max_entries_per_query])
-            fetch_status["queries_succeeded"] += 1
-            fetch_status["entries_found"] += len(entries)
-            
-            for entry in entries:
-                if entry.link in seen_links:
-                    continue
-                skip_article, skip_reason, title_key = should_skip_seen_article(
-                    entry,
-                    news_history,
-                    target=target,
-                    seen_title_keys=seen_title_keys
+            if skip_article:
+                logging.info(
+                    f"   [News History] SKIP already collected ({skip_reason}): {entry.title}"
                 )
-                if skip_article:
-                    logging.info(
-                        f"   [News History] SKIP already collected ({skip_reason}): {entry.title}"
-                    )
-                    seen_links.add(entry.link)
-                    seen_title_keys.add(title_key)
-                    continue
+                seen_links.add(link_key)
+                seen_title_keys.add(compact_title_key(title_key))
+                continue
 
-                seen_links.add(entry.link)
-                seen_title_keys.add(title_key)
-                
-                logging.info(f"   - Processing: {entry.title}")
-                content = scrape_article_content(entry.link)
-                
-                pef_meta = None
-                if target == "pef":
-                    pef_meta = evaluate_pef_article(entry.title, entry.link, content)
-                    decision = "ACCEPT" if pef_meta["accepted"] else "REJECT"
-                    logging.info(
-                        f"   [PEF Filter] {decision} score={pef_meta['score']} "
-                        f"source={pef_meta['source']} categories={', '.join(pef_meta['categories']) or 'None'}"
-                    )
-                    if not pef_meta["accepted"]:
-                        logging.info(f"      reasons: {', '.join(pef_meta['reasons'])}")
-                        continue
+            seen_links.add(link_key)
+            seen_title_keys.add(compact_title_key(title_key))
+            
+            logging.info(f"   - Processing: {entry.title}")
+            candidates.append(entry)
+
+    contents = collect_article_contents(candidates, target=target)
+    for entry, content in zip(candidates, contents):
+        pef_meta = None
+        if target == "pef":
+            pef_meta = evaluate_pef_article(entry.title, entry.link, content)
+            decision = "ACCEPT" if pef_meta["accepted"] else "REJECT"
+            logging.info(
+                f"   [PEF Filter] {decision} score={pef_meta['score']} "
+                f"source={pef_meta['source']} categories={', '.join(pef_meta['categories']) or 'None'}"
+            )
+            if not pef_meta["accepted"]:
+                logging.info(f"      reasons: {', '.join(pef_meta['reasons'])}")
+                continue
 
-                duplicate_title = find_duplicate_event_title(entry.title, accepted_event_titles)
-                if duplicate_title:
-                    logging.info(
-                        f"   [Event Dedupe] SKIP same event: {entry.title} "
-                        f"(matched: {duplicate_title})"
-                    )
-                    continue
+        duplicate_title = find_duplicate_event_title(entry.title, accepted_event_titles)
+        if duplicate_title:
+            logging.info(
+                f"   [Event Dedupe] SKIP same event: {entry.title} "
+                f"(matched: {duplicate_title})"
+            )
+            continue
 
-                combined_news_context = append_article_context(
-                    combined_news_context,
-                    entry,
-                    content,
-                    target=target,
-                    pef_meta=pef_meta if target == "pef" else None
-                )
-                collected_links.append((entry.title, entry.link))
-                accepted_event_titles.append(entry.title)
-                stage_article_for_history(
-                    pending_articles,
-                    entry,
-                    target,
-                    collected_date=collected_date,
-                )
-                    
-        except Exception as e:
-            fetch_status["queries_failed"] += 1
-            fetch_status["errors"].append(f"{query}: {type(e).__name__}: {str(e)[:200]}")
-            logging.error(f"   Error fetching RSS for {query}: {e}")
+        combined_news_context = append_article_context(
+            combined_news_context,
+            entry,
+            content,
+            target=target,
+            pef_meta=pef_meta if target == "pef" else None
+        )
+        collected_links.append((entry.title, entry.link))
+        accepted_event_titles.append(entry.title)
+        stage_article_for_history(
+            pending_articles,
+            entry,
+            target,
+            collected_date=collected_date,
+        )
 
     log_fetch_status(fetch_status, f"target={target}")
     return combined_news_context, collected_links, seen_links, pending_articles, fetch_status
@@ -2784,7 +3493,7 @@ def fetch_firm_mention_news(firm_name, initial_seen_links=None, news_history=Non
     lookback_days = max(1, parse_int_env("PEF_FIRM_NEWS_LOOKBACK_DAYS", 30))
     queries = build_firm_news_queries(firm_name)
     match_terms = build_firm_match_terms(firm_name)
-    seen_links = set(initial_seen_links) if initial_seen_links else set()
+    seen_links = {normalize_news_link(link) for link in initial_seen_links or ()}
     seen_titles = set()
     accepted_event_titles = []
     combined_news_context = ""
@@ -2800,33 +3509,28 @@ def fetch_firm_mention_news(firm_name, initial_seen_links=None, news_history=Non
         f"(lookback={lookback_days}d, queries={', '.join(queries)})"
     )
 
-    for query in queries:
+    # All name variants are searched concurrently up front; results are still
+    # consumed in query order and stop once enough mentions are collected.
+    feed_results = fetch_google_news_feeds(
+        [f'"{query}" when:{lookback_days}d' for query in queries],
+        max_entries=5,
+    )
+    for query, (feed, error) in zip(queries, feed_results):
         if len(collected_links) >= PEF_FIRM_MENTION_MAX_ARTICLES:
             break
-        rss_query = f'"{query}" when:{lookback_days}d'
         fetch_status["queries_attempted"] += 1
         try:
-            response = requests.get(
-                "https://news.google.com/rss/search",
-                params={
-                    "q": rss_query,
-                    "hl": "ko",
-                    "gl": "KR",
-                    "ceid": "KR:ko",
-                },
-                timeout=10,
-            )
-            feed = parse_google_news_feed(response)
+            if error is not None:
+                raise error
             entries = list(feed.entries[:5])
             fetch_status["queries_succeeded"] += 1
             fetch_status["entries_found"] += len(entries)
 
+            candidates = []
             for entry in entries:
-                if len(collected_links) >= PEF_FIRM_MENTION_MAX_ARTICLES:
-                    break
-
-                title_key = normalize_title_for_dedupe(entry.title)
-                if entry.link in seen_links or title_key in seen_titles:
+                title_fingerprint = compact_title_key(normalize_title_for_dedupe(entry.title))
+                link_key = normalize_news_link(entry.link)
+                if link_key in seen_links or title_fingerprint in seen_titles:
                     continue
                 skip_article, skip_reason, title_key = should_skip_seen_article(
                     entry,
@@ -2838,16 +3542,21 @@ def fetch_firm_mention_news(firm_name, initial_seen_links=None, news_history=Non
                     logging.info(
                         f"      [News History] SKIP already collected ({skip_reason}): {entry.title}"
                     )
-                    seen_links.add(entry.link)
-                    seen_titles.add(title_key)
+                    seen_links.add(link_key)
+                    seen_titles.add(title_fingerprint)
                     continue
 
                 # Mark every attempted candidate so rejected results are not scraped
                 # again through another firm-name query in the same run.
-                seen_links.add(entry.link)
-                seen_titles.add(title_key)
+                seen_links.add(link_key)
+                seen_titles.add(title_fingerprint)
                 logging.info(f"   - Firm mention candidate: {entry.title}")
-                content = scrape_article_content(entry.link)
+                candidates.append(entry)
+
+            for entry, content in scrape_candidates_as_needed(
+                candidates,
+                lambda: PEF_FIRM_MENTION_MAX_ARTICLES - len(collected_links),
+            ):
                 searchable_text = normalize_text(entry.title, content, entry.link)
                 is_match, match_reason = match_firm_mention(searchable_text, match_terms, firm_name)
                 if not is_match:
@@ -2915,7 +3624,7 @@ def fetch_watchlist_news(
     lookback_days = fetch_settings["lookback_days"]
     max_candidates = max(1, parse_int_env("PEF_WATCHLIST_MAX_CANDIDATES_PER_QUERY", 5))
     max_per_company = max(1, parse_int_env("PEF_WATCHLIST_MAX_ARTICLES_PER_COMPANY", 2))
-    seen_links = set(initial_seen_links) if initial_seen_links else set()
+    seen_links = {normalize_news_link(link) for link in initial_seen_links or ()}
     combined_news_context = ""
     collected_links = []
     pending_articles = []
@@ -2930,6 +3639,16 @@ def fetch_watchlist_news(
         f"(lookback={lookback_days}d, max_per_company={max_per_company})."
     )
 
+    rss_queries = list(dict.fromkeys(
+        f'"{alias}" when:{lookback_days}d'
+        for company in watchlist
+        for alias in (company.get("aliases") or [company["name"]])
+    ))
+    feed_results = dict(zip(
+        rss_queries,
+        fetch_google_news_feeds(rss_queries, max_entries=max_candidates),
+    ))
+
     for company in watchlist:
         company_name = company["name"]
         aliases = company.get("aliases") or [company_name]
@@ -2940,30 +3659,21 @@ def fetch_watchlist_news(
         for alias in aliases:
             if company_links >= max_per_company:
                 break
-            rss_query = f'"{alias}" when:{lookback_days}d'
+            feed, error = feed_results[f'"{alias}" when:{lookback_days}d']
             fetch_status["queries_attempted"] += 1
             try:
-                response = requests.get(
-                    "https://news.google.com/rss/search",
-                    params={
-                        "q": rss_query,
-                        "hl": "ko",
-                        "gl": "KR",
-                        "ceid": "KR:ko",
-                    },
-                    timeout=10,
-                )
-                feed = parse_google_news_feed(response)
+                if error is not None:
+                    raise error
                 entries = list(feed.entries[:max_candidates])
                 fetch_status["queries_succeeded"] += 1
                 fetch_status["entries_found"] += len(entries)
 
+                candidates = []
                 for entry in entries:
-                    if company_links >= max_per_company:
-                        break
-                    if entry.link in seen_links or entry.link in attempted_links:
+                    link_key = normalize_news_link(entry.link)
+                    if link_key in seen_links or link_key in attempted_links:
                         continue
-                    attempted_links.add(entry.link)
+                    attempted_links.add(link_key)
 
                     skip_article, skip_reason, _title_key = should_skip_seen_article(
                         entry,
@@ -2974,11 +3684,17 @@ def fetch_watchlist_news(
                         logging.info(
                             f"      [News History] SKIP watchlist ({skip_reason}): {entry.title}"
                         )
-                        seen_links.add(entry.link)
+                        seen_links.add(link_key)
                         continue
 
                     logging.info(f"   - Watchlist candidate [{company_name}]: {entry.title}")
-                    content = scrape_article_content(entry.link)
+                    candidates.append((entry, link_key))
+
+                for (entry, link_key), content in scrape_candidates_as_needed(
+                    candidates,
+                    lambda: max_per_company - company_links,
+                    get_link=lambda candidate: candidate[0].link,
+                ):
                     searchable_text = normalize_text(entry.title, content)
                     if not watchlist_company_matches(searchable_text, aliases):
                         logging.info(
@@ -2997,7 +3713,7 @@ def fetch_watchlist_news(
                         )
                         continue
 
-                    seen_links.add(entry.link)
+                    seen_links.add(link_key)
                     accepted_event_titles.append(entry.title)
                     company_links += 1
                     logging.info(f"      [Watchlist] ACCEPT [{company_name}]")
@@ -3047,19 +3763,25 @@ def dedupe_links(links):
     return deduped
 
 
+MARKET_DIRECTION_EMOJI = ("🔻", "➖", "🔺")
+
+
+def format_market_line(name, data):
+    if not data:
+        return f"- {name}: Data Unavailable"
+    change = data['change']
+    emoji = MARKET_DIRECTION_EMOJI[(change > 0) - (change < 0) + 1]
+    return f"- {name}: {data['price']:,.2f} ({emoji} {data['pct_change']:.2f}%)"
+
+
 def build_market_snapshot(market_data, max_items=None):
     if not market_data:
         return "- 시장 데이터 없음"
 
-    lines = []
-    for name, data in market_data.items():
-        if max_items and len(lines) >= max_items:
-            break
-        if data:
-            emoji = "🔺" if data['change'] > 0 else "🔻" if data['change'] < 0 else "➖"
-            lines.append(f"- {name}: {data['price']:,.2f} ({emoji} {data['pct_change']:.2f}%)")
-        else:
-            lines.append(f"- {name}: Data Unavailable")
+    items = list(market_data.items())
+    if max_items:
+        items = items[:max_items]
+    lines = [format_market_line(name, data) for name, data in items]
     return "\n".join(lines) if lines else "- 시장 데이터 없음"
 
 
@@ -3142,77 +3864,47 @@ def build_news_collection_failure_briefing(
 - RSS 연결 상태를 확인한 뒤 재실행하고, 복구 전에는 시장 데이터만 참고합니다."""
 
 # --- Summarizer Module ---
-def generate_briefing(
-    market_data,
-    news_context,
-    mode="weekday",
-    is_us_holiday=False,
-    is_kr_holiday=False,
-    holiday_name_kr=None,
-    holiday_name_us=None,
-    target="general",
-    briefing_date=None,
-    fetch_status=None,
-):
+GENERAL_ROLE_DESCRIPTION = (
+    "You are a cautious market-briefing analyst.\n"
+    "Based only on the supplied Market Data and News Articles, write an evidence-led report."
+)
+GENERAL_BRIEFING_INSTRUCTIONS = """
+    - **Evidence boundary**: Use only numbers, dates, company names, and events present in the input. Never invent an index range, price target, schedule, or causal explanation.
+    - **Market data meaning**: Treat supplied percentages as historical performance, not a forecast. On weekends they are weekly returns; on weekdays they are previous-close returns.
+    - **Uncertainty**: Label unsupported interpretation as "(추론)" and use low confidence when evidence is thin or mixed.
+    - **No trading directives**: Do not use language such as aggressive buy, sell, must buy, or target price. Provide monitoring priorities and conditions instead.
+    - **Article scope**: A single article cannot establish a broad market regime. Separate confirmed facts from a tentative implication.
     """
-    Generates a daily economic briefing with the configured Gemini fallback chain.
+MONDAY_CATCH_UP_INSTRUCTION = """
+    - **Monday catch-up**: Distinguish Friday market-close facts from events reported over the weekend. Summarize this week's schedule only when dates and event names appear in the supplied articles.
+    """
+PEF_ROLE_DESCRIPTION = (
+    "You are the internal morning-briefing writer for {firm_name}, a Korea-focused private equity GP.\n"
+    "Your audience is the deal team, investment committee, and operating partners.\n"
+    "Write like an actionable internal memo, not a public newsletter."
+)
+PEF_BRIEFING_INSTRUCTIONS = """
+    - **Perspective**: Prioritize implications for sourcing, underwriting, financing, exit, and portfolio value creation.
+    - **Firm mention radar**: Use only articles marked "FIRM MENTION ARTICLE" for the {firm_name} mention/news radar. Extract concrete company, institution, or person names from those articles. Do not invent names.
+    - **Tone**: Avoid generic consultant language. Be concise, specific, and action-oriented for {firm_name}.
+    - **Evidence**: Use actual facts from the articles, and separate confirmed facts from inference when needed.
+    - **Decision discipline**: Do not turn a single article or a daily market move into a firm investment conclusion. State uncertainty and the missing evidence.
+    - **Length**: Keep the full briefing concise enough for one Telegram message when possible.
+    """
+PEF_WATCHLIST_INSTRUCTION = """
+    - **Watchlist radar**: Use only articles marked "WATCHLIST ARTICLE" in the watchlist section. Group them by the supplied Watchlist Company name, keep facts separate from GP implications, and do not infer Baikal's intent or participation.
+    """
+BRIEFING_FORMAT_INSTRUCTIONS = """
+    - **Language**: Korean.
+    - **Formatting**:
+        - Use ONLY these Telegram-supported HTML tags: <b>, <i>, <u>, <s>, <code>, <pre>, <a href="...">.
+        - **FORBIDDEN TAGS**: <p>, <ul>, <ol>, <li>, <div>, <span>, <font>, <br>, <h1>..<h6>. DO NOT USE THESE.
+        - **Lists**: Use hyphens (-) or emojis for lists. Do NOT use <ul>/<li>.
+        - **Newlines**: Use actual newlines instead of <br> or <p>.
+        - **Colors**: Do NOT use <font color="...">. Use emojis like 🔴 (Red/Up/Hot) or 🔵 (Blue/Cool/Down) or 🔻/🔺 to represent direction/sentiment.
     """
-    # Construct the prompt
-    reference_date = briefing_date or datetime.now().date()
-    today = reference_date.strftime("%m/%d(%a)")
-    
-    market_summary = f"## Market Data Indices ({get_market_period_label(market_data)})\n"
-    if market_data:
-        for name, data in market_data.items():
-            if data:
-                emoji = "🔺" if data['change'] > 0 else "🔻" if data['change'] < 0 else "➖"
-                market_summary += f"- {name}: {data['price']:,.2f} ({emoji} {data['pct_change']:.2f}%)\n"
-            else:
-                market_summary += f"- {name}: Data Unavailable\n"
-    else:
-        market_summary += "Data Unavailable\n"
-        
-    # Helper to clean up holiday text
-    us_holiday_text = f" (미국 휴장: {holiday_name_us})" if is_us_holiday else ""
-    kr_holiday_text = f" (국내 휴장: {holiday_name_kr})" if is_kr_holiday else ""
-
-    if not (news_context or "").strip():
-        if is_fetch_outage(fetch_status):
-            logging.warning(
-                f"   [News Fetch] All requests failed for target='{target}'. "
-                "Using collection-failure briefing."
-            )
-            return build_news_collection_failure_briefing(
-                market_data,
-                target=target,
-                briefing_date=reference_date,
-                kr_holiday_text=kr_holiday_text,
-            )
-        logging.info(f"   [No News] No new articles for target='{target}'. Using fallback briefing.")
-        return build_no_new_articles_briefing(
-            market_data,
-            target=target,
-            briefing_date=reference_date,
-            kr_holiday_text=kr_holiday_text,
-            fetch_status=fetch_status,
-        )
-
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        return "Error: GEMINI_API_KEY not found in environment variables."
-
-    if is_partial_fetch_failure(fetch_status):
-        news_context = (
-            "## NEWS COLLECTION WARNING\n"
-            "Some RSS queries failed. Base the report only on the articles below and explicitly "
-            "state that coverage was partial.\n\n"
-            + news_context
-        )
 
-    # Define Prompt Template based on Mode
-    if mode == "saturday":
-        # Saturday: Global Market Weekly Summary
-        prompt_content = f"""
+SATURDAY_BRIEFING_TEMPLATE = """
     <b>📊 {today} 글로벌 증시 주간 요약 보고서</b>
     
     <b>🌍 글로벌 시장 상황 (이번 주 마감)</b>
@@ -3241,10 +3933,7 @@ def generate_briefing(
     <b>💡 다음 주 글로벌 체크 포인트 (미리보기)</b>
     - (Briefly mention 1-2 key events expected next week based on news)
         """
-        
-    elif mode == "sunday":
-        # Sunday: Weekly Summary & Next Week Outlook
-        prompt_content = f"""
+SUNDAY_BRIEFING_TEMPLATE = """
     <b>📅 {today} 이번 주 증시 정리 및 다음 주 전망</b>
     
     <b>📉 이번 주 시장 요약 (Review)</b>
@@ -3280,31 +3969,23 @@ def generate_briefing(
     <b>🎯 다음 주 대응 전략</b>
     - (List monitoring priorities and conditions that would change the view; do not give buy/sell instructions.)
         """
-        
-    else:
-        # Weekday: Daily Outlook (Original)
-        
-        # Determine Header
-        header = f"<b>📊 {today} 한국 증시 종합 전망 보고서{kr_holiday_text}</b>"
-        monday_section = ""
-        if reference_date.weekday() == 0:
-            monday_section = """
+WEEKEND_BRIEFING_TEMPLATES = {
+    "saturday": SATURDAY_BRIEFING_TEMPLATE,
+    "sunday": SUNDAY_BRIEFING_TEMPLATE,
+}
+MONDAY_SCHEDULE_SECTION = """
     <b>🗓️ 이번 주 주요 일정</b>
     - (입력 기사에 날짜와 이벤트가 명시된 이번 주 경제지표/정책/기업 일정 최대 4개)
     - (확인 가능한 일정이 없으면 "입력 기사 기준 확인된 일정 없음"으로 표시하고 추정하지 말 것)
 
     ---
             """
-        
-        # US Market Section
-        if is_us_holiday:
-            us_section = f"""
+US_HOLIDAY_SECTION_TEMPLATE = """
     <b>🌍 글로벌 시장 상황 (미국 휴장: {holiday_name_us})</b>
     - <b>미국 증시는 '{holiday_name_us}'로 인해 휴장했습니다.</b>
     - (Instead, summarize any major European or Global economic news if available, or skip with a brief mention.)
             """
-        else:
-            us_section = """
+US_MARKET_SECTION = """
     <b>🌍 글로벌 시장 상황 (미 증시)</b>
     <b>지수</b>
     - (List major US indices: Dow, Nasdaq, S&P500, Russell 2000, Philly Semi with % change)
@@ -3313,36 +3994,31 @@ def generate_briefing(
     <b>핵심 특징</b>
     - (Summarize 2-3 key drivers. Use bolding for keywords.)
             """
-            
-        # KR Market Section (Outlook)
-        if is_kr_holiday:
-            kr_section = f"""
+KR_HOLIDAY_SECTION_TEMPLATE = """
     <b>🇰🇷 한국 증시 상황 (휴장: {holiday_name_kr})</b>
     - <b>오늘은 '{holiday_name_kr}'로 인해 한국 증시가 휴장합니다.</b>
     - (Do NOT provide a specific forecast range or hot themes for trading today.)
     - (Instead, briefly summarize the overall sentiment or recent trend leading into the holiday.)
             """
-            # Outlook sections (Themes, Strategy) should be minimized or removed for holidays
-            extra_section = """
+# Outlook sections (Themes, Strategy) should be minimized or removed for holidays
+KR_HOLIDAY_EXTRA_SECTION = """
     <b>💡 휴장일 체크 포인트</b>
     - (Any major global events to watch during the holiday)
             """
-        else:
-            kr_section = """
+KR_OUTLOOK_SECTION = """
     <b>🇰🇷 한국 증시 오늘 전망</b>
     - <b>방향성</b>: (상승 우위/중립/하락 우위 중 하나. 입력 근거가 약하면 중립)
     - <b>신뢰도</b>: (낮음/보통/높음 중 하나)
     - <b>근거</b>: (입력 데이터와 기사에서 확인되는 근거 2-3개)
             """
-            extra_section = """
+KR_OUTLOOK_EXTRA_SECTION = """
     <b>🔎 오늘의 관찰 테마</b>
     - (기사에 직접 근거가 있는 섹터/테마 최대 2개와 확인할 조건)
 
     <b>🎯 리스크 체크</b>
     - (전망을 무효화할 변수와 오늘 확인할 데이터 2-3개)
             """
-
-        prompt_content = f"""
+WEEKDAY_BRIEFING_TEMPLATE = """
     {header}
     
     {us_section}
@@ -3357,25 +4033,14 @@ def generate_briefing(
     <b>🎬 결론</b>
     (One sentence summary)
         """
-
-    if target == "pef":
-        pef_context = get_pef_persona_config()
-        firm_name = pef_context["firm_name"]
-        has_watchlist_articles = "--- WATCHLIST ARTICLE START ---" in (news_context or "")
-        watchlist_section = ""
-        watchlist_instruction = ""
-        if has_watchlist_articles:
-            watchlist_section = """
+PEF_WATCHLIST_SECTION = """
     <b>🔎 관심 기업 뉴스 레이더</b>
     - (WATCHLIST ARTICLE을 회사별로 묶어 신규 동향, GP 관점 시사점, 추가 확인사항을 각 1-2문장으로 정리)
     - (기사에 없는 거래 참여, 가격, 일정, 의사결정은 추정하지 말 것)
 
     ---
             """
-            watchlist_instruction = """
-    - **Watchlist radar**: Use only articles marked "WATCHLIST ARTICLE" in the watchlist section. Group them by the supplied Watchlist Company name, keep facts separate from GP implications, and do not infer Baikal's intent or participation.
-    """
-        prompt_content = f"""
+PEF_BRIEFING_TEMPLATE = """
     <b>👔 {today} {firm_name} GP 인사이트 브리핑{kr_holiday_text}</b>
     
     <b>📊 오늘의 투자위원회 한 줄 판단</b>
@@ -3417,40 +4082,139 @@ def generate_briefing(
     <b>GP Action</b>
     - (투자팀이 오늘 확인/실행할 일 1-2개)
         """
-        role_description = (
-            f"You are the internal morning-briefing writer for {firm_name}, a Korea-focused private equity GP.\n"
-            "Your audience is the deal team, investment committee, and operating partners.\n"
-            "Write like an actionable internal memo, not a public newsletter."
-        )
-        specific_instructions = f"""
-    - **Perspective**: Prioritize implications for sourcing, underwriting, financing, exit, and portfolio value creation.
-    {watchlist_instruction}
-    - **Firm mention radar**: Use only articles marked "FIRM MENTION ARTICLE" for the {firm_name} mention/news radar. Extract concrete company, institution, or person names from those articles. Do not invent names.
-    - **Tone**: Avoid generic consultant language. Be concise, specific, and action-oriented for {firm_name}.
-    - **Evidence**: Use actual facts from the articles, and separate confirmed facts from inference when needed.
-    - **Decision discipline**: Do not turn a single article or a daily market move into a firm investment conclusion. State uncertainty and the missing evidence.
-    - **Length**: Keep the full briefing concise enough for one Telegram message when possible.
+
+
+def build_system_instruction(target="general", firm_name=None):
+    if target == "pef":
+        role_description = PEF_ROLE_DESCRIPTION.format(firm_name=firm_name)
+        specific_instructions = PEF_BRIEFING_INSTRUCTIONS.format(firm_name=firm_name)
+    else:
+        role_description = GENERAL_ROLE_DESCRIPTION
+        specific_instructions = GENERAL_BRIEFING_INSTRUCTIONS
+
+    return f"""
+    {role_description}
+    
+    **Instructions:**
+    {BRIEFING_FORMAT_INSTRUCTIONS}
+    {specific_instructions}
     """
+
+
+def generate_briefing(
+    market_data,
+    news_context,
+    mode="weekday",
+    is_us_holiday=False,
+    is_kr_holiday=False,
+    holiday_name_kr=None,
+    holiday_name_us=None,
+    target="general",
+    briefing_date=None,
+    fetch_status=None,
+):
+    """
+    Generates a daily economic briefing with the configured Gemini fallback chain.
+    """
+    # Construct the prompt
+    reference_date = briefing_date or datetime.now().date()
+    today = reference_date.strftime("%m/%d(%a)")
+    
+    summary_parts = [f"## Market Data Indices ({get_market_period_label(market_data)})\n"]
+    if market_data:
+        summary_parts.extend(
+            f"{format_market_line(name, data)}\n" for name, data in market_data.items()
+        )
     else:
-        role_description = (
-            "You are a cautious market-briefing analyst.\n"
-            "Based only on the supplied Market Data and News Articles, write an evidence-led report."
+        summary_parts.append("Data Unavailable\n")
+    market_summary = "".join(summary_parts)
+        
+    # Helper to clean up holiday text
+    us_holiday_text = f" (미국 휴장: {holiday_name_us})" if is_us_holiday else ""
+    kr_holiday_text = f" (국내 휴장: {holiday_name_kr})" if is_kr_holiday else ""
+
+    if not (news_context or "").strip():
+        if is_fetch_outage(fetch_status):
+            logging.warning(
+                f"   [News Fetch] All requests failed for target='{target}'. "
+                "Using collection-failure briefing."
+            )
+            return build_news_collection_failure_briefing(
+                market_data,
+                target=target,
+                briefing_date=reference_date,
+                kr_holiday_text=kr_holiday_text,
+            )
+        logging.info(f"   [No News] No new articles for target='{target}'. Using fallback briefing.")
+        return build_no_new_articles_briefing(
+            market_data,
+            target=target,
+            briefing_date=reference_date,
+            kr_holiday_text=kr_holiday_text,
+            fetch_status=fetch_status,
         )
-        specific_instructions = """
-    - **Evidence boundary**: Use only numbers, dates, company names, and events present in the input. Never invent an index range, price target, schedule, or causal explanation.
-    - **Market data meaning**: Treat supplied percentages as historical performance, not a forecast. On weekends they are weekly returns; on weekdays they are previous-close returns.
-    - **Uncertainty**: Label unsupported interpretation as "(추론)" and use low confidence when evidence is thin or mixed.
-    - **No trading directives**: Do not use language such as aggressive buy, sell, must buy, or target price. Provide monitoring priorities and conditions instead.
-    - **Article scope**: A single article cannot establish a broad market regime. Separate confirmed facts from a tentative implication.
-    """
+
+    api_key = os.getenv("GEMINI_API_KEY")
+    if not api_key:
+        return "Error: GEMINI_API_KEY not found in environment variables."
+
+    if is_partial_fetch_failure(fetch_status):
+        news_context = (
+            "## NEWS COLLECTION WARNING\n"
+            "Some RSS queries failed. Base the report only on the articles below and explicitly "
+            "state that coverage was partial.\n\n"
+            + news_context
+        )
+
+    # Define Prompt Template based on Mode
+    if mode in WEEKEND_BRIEFING_TEMPLATES:
+        prompt_content = WEEKEND_BRIEFING_TEMPLATES[mode].format(today=today)
+    else:
+        # Weekday: Daily Outlook
+        if is_us_holiday:
+            us_section = US_HOLIDAY_SECTION_TEMPLATE.format(holiday_name_us=holiday_name_us)
+        else:
+            us_section = US_MARKET_SECTION
+
+        if is_kr_holiday:
+            kr_section = KR_HOLIDAY_SECTION_TEMPLATE.format(holiday_name_kr=holiday_name_kr)
+            extra_section = KR_HOLIDAY_EXTRA_SECTION
+        else:
+            kr_section = KR_OUTLOOK_SECTION
+            extra_section = KR_OUTLOOK_EXTRA_SECTION
+
+        prompt_content = WEEKDAY_BRIEFING_TEMPLATE.format(
+            header=f"<b>📊 {today} 한국 증시 종합 전망 보고서{kr_holiday_text}</b>",
+            us_section=us_section,
+            monday_section=MONDAY_SCHEDULE_SECTION if reference_date.weekday() == 0 else "",
+            kr_section=kr_section,
+            extra_section=extra_section,
+        )
+
+    extra_instructions = ""
+    if target == "pef":
+        pef_context = get_pef_persona_config()
+        firm_name = pef_context["firm_name"]
+        has_watchlist_articles = "--- WATCHLIST ARTICLE START ---" in (news_context or "")
+        watchlist_section = ""
+        if has_watchlist_articles:
+            watchlist_section = PEF_WATCHLIST_SECTION
+            extra_instructions = PEF_WATCHLIST_INSTRUCTION
+        prompt_content = PEF_BRIEFING_TEMPLATE.format(
+            today=today,
+            firm_name=firm_name,
+            kr_holiday_text=kr_holiday_text,
+            watchlist_section=watchlist_section,
+        )
+        system_instruction = build_system_instruction(target, firm_name)
+    else:
         if mode == "weekday" and reference_date.weekday() == 0:
-            specific_instructions += """
-    - **Monday catch-up**: Distinguish Friday market-close facts from events reported over the weekend. Summarize this week's schedule only when dates and event names appear in the supplied articles.
-    """
+            extra_instructions = MONDAY_CATCH_UP_INSTRUCTION
+        system_instruction = build_system_instruction(target)
 
+    # Only the per-run parts (date, holidays, inputs) go into contents; the
+    # system instruction stays byte-identical across runs for prefix caching.
     prompt = f"""
-    {role_description}
-    
     **Format Requirements (Strictly Follow This Structure)**:
     {prompt_content}
     
@@ -3458,50 +4222,120 @@ def generate_briefing(
     {market_summary}
     
     {news_context}
-    
-    **Instructions:**
-    - **Language**: Korean.
-    - **Formatting**:
-        - Use ONLY these Telegram-supported HTML tags: <b>, <i>, <u>, <s>, <code>, <pre>, <a href="...">.
-        - **FORBIDDEN TAGS**: <p>, <ul>, <ol>, <li>, <div>, <span>, <font>, <br>, <h1>..<h6>. DO NOT USE THESE.
-        - **Lists**: Use hyphens (-) or emojis for lists. Do NOT use <ul>/<li>.
-        - **Newlines**: Use actual newlines instead of <br> or <p>.
-        - **Colors**: Do NOT use <font color="...">. Use emojis like 🔴 (Red/Up/Hot) or 🔵 (Blue/Cool/Down) or 🔻/🔺 to represent direction/sentiment.
-    {specific_instructions}
+    """
+    if extra_instructions:
+        prompt += f"""
+    **Additional Instructions:**
+    {extra_instructions}
     """
 
     models_to_try = get_gemini_models()
     max_attempts = max(1, parse_int_env("GEMINI_MAX_ATTEMPTS_PER_MODEL", 1))
     retry_delay = max(1, parse_int_env("GEMINI_RETRY_DELAY_SECONDS", 5))
-    client = genai.Client(api_key=api_key)
+    cache_settings = get_gemini_cache_settings()
+
+    if cache_settings:
+        for model_name in models_to_try:
+            cached = load_cached_briefing(cache_settings, build_gemini_cache_key(model_name, system_instruction + prompt))
+            if cached:
+                logging.info(f"   [Gemini Cache] Reusing cached {model_name} briefing for target='{target}'.")
+                return cached
+
+    client = get_gemini_client(api_key)
+    config = get_gemini_generate_config(
+        system_instruction,
+        max(0, parse_int_env("GEMINI_TIMEOUT_SECONDS", DEFAULT_GEMINI_TIMEOUT_SECONDS)),
+    )
     
     logging.info(f"   [Debug] Generating briefing for mode: {mode}")
-    
-    for model_name in models_to_try:
-        logging.info(f"   Using model: {model_name}...")
 
-        for attempt in range(max_attempts):
-            try:
-                response = client.models.generate_content(model=model_name, contents=prompt)
-                if not response.text:
-                    raise ValueError("Gemini returned an empty response")
-                return response.text.strip()
-            except Exception as e:
-                if is_rate_limit_error(e):
-                    logging.warning(
-                        f"   [Rate Limit] {model_name} unavailable; switching to the next model."
-                    )
-                    break
+    def request_model(model_name):
+        # Earlier models fail over after one try; only the last one retries.
+        attempts = max_attempts if model_name == models_to_try[-1] else 1
+        return request_briefing_from_model(
+            client, model_name, prompt, attempts, retry_delay, config=config
+        )
+
+    model_name, briefing = run_hedged_model_requests(
+        models_to_try,
+        request_model,
+        max(0, parse_int_env("GEMINI_HEDGE_DELAY_SECONDS", 0)),
+    )
+    if not briefing:
+        return "Error: Failed to generate briefing with all available models."
+
+    if cache_settings:
+        store_cached_briefing(
+            cache_settings, build_gemini_cache_key(model_name, system_instruction + prompt), briefing
+        )
+    return briefing
+
+
+def request_briefing_from_model(client, model_name, prompt, max_attempts, retry_delay, config=None):
+    logging.info(f"   Using model: {model_name}...")
 
+    for attempt in range(max_attempts):
+        try:
+            # Streaming starts receiving text at the first token instead of holding
+            # the connection silent until the whole briefing is written.
+            stream = client.models.generate_content_stream(
+                model=model_name, contents=prompt, config=config
+            )
+            text = "".join(chunk.text or "" for chunk in stream)
+            if not text.strip():
+                raise ValueError("Gemini returned an empty response")
+            return text.strip()
+        except Exception as e:
+            if is_rate_limit_error(e):
+                logging.warning(f"   [Rate Limit] {model_name} unavailable.")
+            else:
                 logging.error(
                     f"   Error with {model_name} (attempt {attempt + 1}/{max_attempts}): {e}"
                 )
-                if attempt + 1 < max_attempts:
-                    time.sleep(retry_delay * (attempt + 1))
-        
-        logging.warning(f"   Failed with {model_name}, attempting fallback...")
-    
-    return "Error: Failed to generate briefing with all available models."
+            if attempt + 1 < max_attempts:
+                delay = get_gemini_retry_delay(e, retry_delay, attempt)
+                logging.info(f"   Retrying {model_name} in {delay:.1f} seconds...")
+                time.sleep(delay)
+
+    logging.warning(f"   Failed with {model_name}, attempting fallback...")
+    return None
+
+
+def run_hedged_model_requests(models, request_model, hedge_delay=0):
+    """
+    Walks the model fallback chain. With a hedge delay, the next model is also
+    started when the current one has not answered within hedge_delay seconds,
+    and whichever succeeds first wins. A delay of 0 keeps the chain sequential.
+    """
+    remaining = list(models)
+    if not remaining:
+        return None, None
+
+    executor = ThreadPoolExecutor(max_workers=len(remaining))
+    pending = {}
+    try:
+        model_name = remaining.pop(0)
+        pending[executor.submit(request_model, model_name)] = model_name
+        while pending:
+            timeout = hedge_delay if remaining and hedge_delay > 0 else None
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                model_name = pending.pop(future)
+                briefing = future.result()
+                if briefing:
+                    return model_name, briefing
+
+            if remaining:
+                if not done:
+                    logging.info(
+                        f"   [Hedge] No response after {hedge_delay}s; also trying {remaining[0]}."
+                    )
+                model_name = remaining.pop(0)
+                pending[executor.submit(request_model, model_name)] = model_name
+        return None, None
+    finally:
+        # A slower hedged call cannot be interrupted; let it finish in the background.
+        executor.shutdown(wait=False, cancel_futures=True)
 
 # --- Notifier Module ---
 def redact_sensitive_text(value, *secrets):
@@ -3827,7 +4661,7 @@ def send_telegram_message(message, target="general"):
         
     url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
 
-    sanitized_html_message = sanitize_telegram_html(message)
+    sanitized_html_message = strip_unsupported_telegram_tags(sanitize_telegram_html(message))
     logging.info(
         f"   Prepared Telegram message for target='{target}' "
         f"(raw={len(message)} chars, html_sanitized={len(sanitized_html_message)} chars)."
@@ -3884,7 +4718,22 @@ def send_telegram_message(message, target="general"):
         return False
 
 # --- Main Execution ---
+def parse_cli_args(argv):
+    parser = argparse.ArgumentParser(description="Daily economic briefing service")
+    parser.add_argument("command", nargs="?", choices=["test"], help="run without delivery or history updates")
+    parser.add_argument("--test", action="store_true", help="same as the 'test' command")
+    parser.add_argument("--mode", choices=["weekday", "saturday", "sunday"], help="override the weekday-based mode")
+    parser.add_argument("--date", help="run as if today were YYYY-MM-DD")
+    parser.add_argument("--no-news-history", action="store_true", help="ignore and do not update news history")
+    parser.add_argument("--no-cache", action="store_true", help="skip the HTTP, Gemini and market data caches")
+    args = parser.parse_args(argv)
+    args.test = args.test or args.command == "test"
+    return args
+
+
 def main():
+    global LOCAL_CACHES_BYPASSED
+
     # Load environment variables
     load_dotenv()
 
@@ -3895,21 +4744,23 @@ def main():
     # Check for CLI arguments
     # Usage: python main.py --mode saturday
     # Usage: python main.py --date 2023-12-25
-    args = sys.argv[1:] if len(sys.argv) > 1 else []
-    test_mode = "test" in args or "--test" in args
-    custom_date_run = "--date" in args
-    news_history_enabled = parse_bool_env("NEWS_HISTORY_ENABLED", True) and "--no-news-history" not in args
+    args = parse_cli_args(sys.argv[1:])
+    if args.no_cache:
+        LOCAL_CACHES_BYPASSED = True
+        logging.info("   [Cache] Disabled for this run.")
+    configure_http_cache()
+    test_mode = args.test
+    custom_date_run = args.date is not None
+    news_history_enabled = parse_bool_env("NEWS_HISTORY_ENABLED", True) and not args.no_news_history
     
     # Determine 'today' for holiday checking
     today = datetime.now().date()
-    if "--date" in args:
+    if custom_date_run:
         try:
-            idx = args.index("--date")
-            date_str = args[idx+1]
-            today = datetime.strptime(date_str, "%Y-%m-%d").date()
+            today = datetime.strptime(args.date, "%Y-%m-%d").date()
             logging.info(f"   [Debug] Using custom date: {today}")
-        except (IndexError, ValueError) as e:
-             logging.error(f"Error: --date requires YYYY-MM-DD format. Using today. {e}")
+        except ValueError as e:
+            logging.error(f"Error: --date requires YYYY-MM-DD format. Using today. {e}")
     
     # Check Holidays
     is_kr_holiday, is_us_holiday_prev_close, holiday_name_kr, holiday_name_us = check_holidays(today)
@@ -3924,12 +4775,8 @@ def main():
         mode = "sunday"
         
     # Mode override
-    if "--mode" in args:
-        try:
-            idx = args.index("--mode")
-            mode = args[idx+1]
-        except IndexError:
-            logging.error("Error: --mode requires an argument (weekday/saturday/sunday)")
+    if args.mode:
+        mode = args.mode
         
     logging.info(f"--- Daily Economic Briefing Service (Mode: {mode.upper()}) ---")
     if is_kr_holiday:
@@ -3946,24 +4793,32 @@ def main():
         logging.info("   [News History] Test mode: history will be read but not saved.")
     
     # 1. Fetch Data
+    # Market data and news are independent, so yfinance runs in the background
+    # while the RSS searches and article scrapes proceed.
     logging.info("1. Fetching Market Data...")
-    market_data = fetch_market_data(mode=mode)
-    
-    # Pass US holiday status for news fetching logic
-    (
-        news_context_general,
-        general_links,
-        _,
-        pending_general,
-        general_fetch_status,
-    ) = fetch_news(
-        mode=mode,
-        is_us_holiday=is_us_holiday_prev_close,
-        is_kr_holiday=is_kr_holiday,
-        target="general",
-        news_history=news_history,
-        collected_date=today
-    )
+    with ThreadPoolExecutor(max_workers=1) as market_executor:
+        market_future = market_executor.submit(
+            fetch_market_data_cached,
+            mode=mode,
+            reference_date=today,
+        )
+
+        # Pass US holiday status for news fetching logic
+        (
+            news_context_general,
+            general_links,
+            _,
+            pending_general,
+            general_fetch_status,
+        ) = fetch_news(
+            mode=mode,
+            is_us_holiday=is_us_holiday_prev_close,
+            is_kr_holiday=is_kr_holiday,
+            target="general",
+            news_history=news_history,
+            collected_date=today
+        )
+        market_data = market_future.result()
     
     # 3. Generate Briefing (Pass Mode & Holiday Context)
     logging.info("3. Generating General Briefing using Gemini...")
@@ -4098,26 +4953,32 @@ def main():
     pef_source_links = dedupe_links(firm_mention_links + pef_links)
 
     # 9. Fetch official bond issuance market data for the PEF channel.
+    # The bond section is appended after generation, so the fetch (which may
+    # poll for late filings) runs while Gemini writes the PEF briefing.
     logging.info("8. Fetching Bond Issuance Market Data (DART/KOFIA/NH PDF)...")
-    bond_market_data = fetch_bond_market_data(
-        today,
-        allow_wait=not (test_mode or custom_date_run or is_kr_holiday),
-    )
+    with ThreadPoolExecutor(max_workers=1) as bond_executor:
+        bond_future = bond_executor.submit(
+            fetch_bond_market_data,
+            today,
+            allow_wait=not (test_mode or custom_date_run or is_kr_holiday),
+        )
+
+        # 10. Generate PEF Briefing
+        logging.info("9. Generating PEF Briefing using Gemini...")
+        briefing_pef = generate_briefing(
+            market_data, 
+            combined_pef_context,
+            mode=mode,
+            is_us_holiday=is_us_holiday_prev_close,
+            is_kr_holiday=is_kr_holiday,
+            holiday_name_kr=holiday_name_kr,
+            holiday_name_us=holiday_name_us,
+            target="pef",
+            briefing_date=today,
+            fetch_status=combined_pef_fetch_status,
+        )
+        bond_market_data = bond_future.result()
 
-    # 10. Generate PEF Briefing
-    logging.info("9. Generating PEF Briefing using Gemini...")
-    briefing_pef = generate_briefing(
-        market_data, 
-        combined_pef_context,
-        mode=mode,
-        is_us_holiday=is_us_holiday_prev_close,
-        is_kr_holiday=is_kr_holiday,
-        holiday_name_kr=holiday_name_kr,
-        holiday_name_us=holiday_name_us,
-        target="pef",
-        briefing_date=today,
-        fetch_status=combined_pef_fetch_status,
-    )
     if briefing_generation_succeeded(briefing_pef):
         bond_market_section = build_bond_market_section(
             bond_market_data,
@@ -1,17 +1,77 @@
 import unittest
+import base64
+import io
 import json
+import logging
 import tempfile
+import threading
+import time
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import Mock, patch
+from urllib.parse import parse_qs, urlsplit
 
 import pandas as pd
 import requests
+import requests_cache
+import urllib3
 
 import main
 
 
+def rss_query_from_url(url):
+    return parse_qs(urlsplit(url).query)["q"][0]
+
+
+class TrackedBody(io.BytesIO):
+    """
+    Counts how many bytes of the body the client actually pulled.
+    """
+
+    bytes_read = 0
+
+    def read(self, size=-1):
+        chunk = super().read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+    def readinto(self, buffer):
+        count = super().readinto(buffer)
+        self.bytes_read += count
+        return count
+
+
+class StubBodyAdapter(requests.adapters.BaseAdapter):
+    """
+    Serves canned streaming bodies so tests can see how much of each one was read.
+    """
+
+    def __init__(self, pages):
+        super().__init__()
+        self.pages = pages
+
+    def send(self, request, **kwargs):
+        content_type, body = self.pages[request.url]
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = content_type
+        response.encoding = "utf-8"
+        response.raw = urllib3.HTTPResponse(
+            body=body,
+            headers={"Content-Type": content_type},
+            status=200,
+            preload_content=False,
+            request_url=request.url,
+        )
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
 class PefFilterTests(unittest.TestCase):
     def test_accepts_pef_industry_and_deal_headlines(self):
         content = "사모펀드 업계 제도 개선과 운용사 의견을 다룬 기사입니다. " * 12
@@ -89,6 +149,92 @@ class EventDedupeTests(unittest.TestCase):
         self.assertTrue(main.is_same_news_event(first, second))
 
 
+class LinkDedupeTests(unittest.TestCase):
+    def build_google_news_link(self, url):
+        payload = b"\x08\x13\x22" + bytes([len(url)]) + url.encode("ascii") + b"\xd2\x01\x00"
+        article_id = base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+        return f"https://news.google.com/rss/articles/{article_id}?oc=5"
+
+    def test_decodes_publisher_url_from_google_news_link(self):
+        link = self.build_google_news_link("https://www.example.co.kr/news/articleView.html?idxno=123")
+
+        self.assertEqual(
+            main.decode_google_news_link(link),
+            "https://www.example.co.kr/news/articleView.html?idxno=123",
+        )
+        self.assertIsNone(main.decode_google_news_link("https://news.google.com/rss/articles/AU_yqLopaque"))
+        self.assertIsNone(main.decode_google_news_link("https://example.com/rss/articles/abc"))
+
+    def test_normalized_key_drops_tracking_but_keeps_article_id(self):
+        wrapped = self.build_google_news_link("https://Example.com/view/?idxno=7&utm_source=google")
+
+        self.assertEqual(
+            main.normalize_news_link("https://example.com/view?idxno=7&fbclid=abc#comments"),
+            main.normalize_news_link(wrapped),
+        )
+        self.assertNotEqual(
+            main.normalize_news_link("https://example.com/view?idxno=7"),
+            main.normalize_news_link("https://example.com/view?idxno=8"),
+        )
+
+    @patch.dict("os.environ", {}, clear=True)
+    @patch("main.scrape_article_content", side_effect=lambda url: f"body of {url}")
+    @patch("main.fetch_google_news_feeds")
+    def test_same_article_behind_different_links_is_scraped_once(self, mock_feeds, mock_scrape):
+        publisher_url = "https://example.com/markets/kospi"
+        mock_feeds.return_value = [
+            (SimpleNamespace(entries=[SimpleNamespace(
+                title="코스피 반등 - 연합뉴스",
+                link=self.build_google_news_link(publisher_url),
+                published="2026-08-11",
+            )]), None),
+            (SimpleNamespace(entries=[SimpleNamespace(
+                title="코스피 외국인 순매수 - 한국경제",
+                link=f"{publisher_url}/?utm_medium=rss",
+                published="2026-08-11",
+            )]), None),
+        ]
+
+        _context, links, _seen, _pending, _status = main.fetch_news(
+            target="general", collected_date=date(2026, 8, 11)
+        )
+
+        self.assertEqual(len(links), 1)
+        mock_scrape.assert_called_once_with(publisher_url)
+
+    @patch.dict("os.environ", {}, clear=True)
+    @patch("main.scrape_article_content", return_value="본문")
+    @patch("main.fetch_google_news_feeds")
+    def test_punctuation_variants_of_a_title_are_scraped_once(self, mock_feeds, mock_scrape):
+        mock_feeds.return_value = [
+            (SimpleNamespace(entries=[SimpleNamespace(
+                title="[속보] 코스피, 2% 상승 마감 - 연합뉴스",
+                link="https://example.com/a",
+                published="2026-08-11",
+            )]), None),
+            (SimpleNamespace(entries=[SimpleNamespace(
+                title="속보 코스피 2% 상승 마감 - 연합뉴스TV",
+                link="https://example.org/b",
+                published="2026-08-11",
+            )]), None),
+        ]
+
+        _context, links, _seen, _pending, _status = main.fetch_news(
+            target="general", collected_date=date(2026, 8, 11)
+        )
+
+        self.assertEqual(links, [("[속보] 코스피, 2% 상승 마감 - 연합뉴스", "https://example.com/a")])
+        mock_scrape.assert_called_once_with("https://example.com/a")
+
+    def test_title_fingerprint_keeps_numeric_punctuation(self):
+        def fingerprint(title):
+            return main.compact_title_key(main.normalize_title_for_dedupe(title))
+
+        self.assertEqual(fingerprint("[속보] 코스피, 2% 상승 - 연합뉴스"), fingerprint("속보 코스피 2% 상승"))
+        self.assertNotEqual(fingerprint("삼성전자, 1.2조 투자"), fingerprint("삼성전자 12조 투자"))
+        self.assertNotEqual(fingerprint("기준금리 3.5% 동결"), fingerprint("기준금리 35% 동결"))
+
+
 class HistoryTransactionTests(unittest.TestCase):
     def test_staging_does_not_mark_article_collected(self):
         history = main.build_news_history_state([], "/tmp/news-history-test.json")
@@ -198,6 +344,107 @@ class HistoryTransactionTests(unittest.TestCase):
         self.assertIn("PEF deal", pef_email_body)
 
 
+class LoggingSetupTests(unittest.TestCase):
+    def setUp(self):
+        self.root_level = logging.getLogger().level
+
+    def tearDown(self):
+        main.stop_log_queue_listener()
+        logging.getLogger().handlers.clear()
+        logging.getLogger().setLevel(self.root_level)
+
+    def test_queued_records_reach_log_file_after_repeated_setup(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_path = Path(temp_dir) / "run.log"
+            with patch.dict("os.environ", {"LOG_FILE_PATH": str(log_path)}), patch("sys.stdout"):
+                main.setup_logging()
+                listener = main.LOG_QUEUE_LISTENER
+                main.setup_logging()
+                self.assertIs(main.LOG_QUEUE_LISTENER, listener)
+                logging.info("queued message")
+                main.stop_log_queue_listener()
+
+            self.assertEqual(len(logging.getLogger().handlers), 1)
+            self.assertIn("INFO - queued message", log_path.read_text(encoding="utf-8"))
+
+
+class HolidayCheckTests(unittest.TestCase):
+    def test_previous_weekday_skips_back_over_the_weekend(self):
+        # Friday 2026-07-03 is the observed US Independence Day.
+        for today in (date(2026, 7, 4), date(2026, 7, 5), date(2026, 7, 6)):
+            _kr, is_us_holiday, _kr_name, us_name = main.check_holidays(today)
+            self.assertTrue(is_us_holiday, today)
+            self.assertEqual(us_name, "Independence Day (observed)")
+
+        self.assertFalse(main.check_holidays(date(2026, 7, 7))[1])
+
+
+class CliArgsTests(unittest.TestCase):
+    def test_parses_documented_invocations(self):
+        args = main.parse_cli_args(["--mode", "sunday", "test"])
+        self.assertEqual(args.mode, "sunday")
+        self.assertTrue(args.test)
+
+        args = main.parse_cli_args(["--date", "2024-12-25", "--test", "--no-news-history"])
+        self.assertEqual(args.date, "2024-12-25")
+        self.assertTrue(args.test)
+        self.assertTrue(args.no_news_history)
+
+        args = main.parse_cli_args(["--no-cache"])
+        self.assertTrue(args.no_cache)
+
+        args = main.parse_cli_args([])
+        self.assertFalse(args.test)
+        self.assertFalse(args.no_cache)
+        self.assertIsNone(args.mode)
+
+    def test_rejects_unknown_mode(self):
+        with patch("sys.stderr"), self.assertRaises(SystemExit):
+            main.parse_cli_args(["--mode", "holiday"])
+
+
+class TelegramNotifierTests(unittest.TestCase):
+    @patch.dict(
+        "os.environ",
+        {"TELEGRAM_BOT_TOKEN": "test-token", "TELEGRAM_CHANNEL_ID": "@channel"},
+        clear=True,
+    )
+    @patch("main.HTTP_SESSION.post")
+    def test_forbidden_tags_are_rewritten_before_the_single_html_send(self, mock_post):
+        mock_post.return_value = Mock(status_code=200, ok=True, text="{}")
+        message = (
+            "<b>📊 브리핑</b><p>S&P 500 상승<br>코스피 < 2700</p>"
+            "<ul><li>반도체</li><li>2차전지</li></ul>"
+        )
+
+        self.assertTrue(main.send_telegram_message(message))
+
+        mock_post.assert_called_once()
+        payload = mock_post.call_args.kwargs["json"]
+        self.assertEqual(payload["parse_mode"], "HTML")
+        self.assertEqual(
+            payload["text"],
+            "<b>📊 브리핑</b>S&amp;P 500 상승\n코스피 &lt; 2700\n- 반도체\n- 2차전지\n",
+        )
+
+    @patch.dict(
+        "os.environ",
+        {"TELEGRAM_BOT_TOKEN": "test-token", "TELEGRAM_CHANNEL_ID": "@channel"},
+        clear=True,
+    )
+    @patch("main.time.sleep")
+    @patch("main.HTTP_SESSION.post")
+    def test_rate_limited_chunk_waits_for_retry_after(self, mock_post, mock_sleep):
+        rate_limited = Mock(status_code=429, ok=False, headers={})
+        rate_limited.json.return_value = {"ok": False, "parameters": {"retry_after": 3}}
+        mock_post.side_effect = [rate_limited, Mock(status_code=200, ok=True)]
+
+        self.assertTrue(main.send_telegram_message("<b>브리핑</b>"))
+
+        self.assertEqual(mock_post.call_count, 2)
+        mock_sleep.assert_called_once_with(3)
+
+
 class EmailNotifierTests(unittest.TestCase):
     @patch.dict(
         "os.environ",
@@ -375,7 +622,7 @@ class NewsScheduleTests(unittest.TestCase):
     @patch.dict("os.environ", {}, clear=True)
     @patch("main.scrape_article_content", return_value="article body")
     @patch("main.parse_google_news_feed")
-    @patch("main.requests.get", return_value=Mock())
+    @patch("main.HTTP_SESSION.get", return_value=Mock())
     def test_monday_fetch_uses_three_day_window_and_five_entries(
         self,
         mock_get,
@@ -398,7 +645,7 @@ class NewsScheduleTests(unittest.TestCase):
             collected_date=date(2026, 8, 10),
         )
 
-        first_query = mock_get.call_args_list[0].kwargs["params"]["q"]
+        first_query = rss_query_from_url(mock_get.call_args_list[0].args[0])
         self.assertIn("when:3d", first_query)
         self.assertEqual(len(links), 5)
         self.assertEqual(len(pending), 5)
@@ -451,24 +698,28 @@ class PefWatchlistTests(unittest.TestCase):
     )
     @patch("main.scrape_article_content", return_value="관심 기업 관련 기사 본문")
     @patch("main.parse_google_news_feed")
-    @patch("main.requests.get", return_value=Mock())
+    @patch("main.HTTP_SESSION.get", side_effect=lambda url, timeout=None: url)
     def test_collects_and_groups_news_by_watchlist_company(
         self,
         mock_get,
         mock_parse_feed,
         _mock_scrape,
     ):
-        mock_parse_feed.side_effect = [
-            SimpleNamespace(entries=[SimpleNamespace(
+        # Feeds are fetched concurrently, so answer by query rather than call order.
+        feeds = {
+            "모노틱": SimpleNamespace(entries=[SimpleNamespace(
                 title="모노틱, 신규 사업 확대 - 연합뉴스",
                 link="https://example.com/monotic",
                 published="2026-08-08",
             )]),
-            SimpleNamespace(entries=[SimpleNamespace(
+            "페퍼저축은행": SimpleNamespace(entries=[SimpleNamespace(
                 title="페퍼저축은행, 건전성 관리 강화 - 한국경제",
                 link="https://example.com/pepper",
                 published="2026-08-08",
             )]),
+        }
+        mock_parse_feed.side_effect = lambda url, max_entries=None: feeds[
+            rss_query_from_url(url).split('"')[1]
         ]
         watchlist = [
             {"name": "모노틱", "aliases": ["모노틱"]},
@@ -489,14 +740,77 @@ class PefWatchlistTests(unittest.TestCase):
         self.assertIn("Watchlist Company: 페퍼저축은행", context)
         self.assertIn("<b>모노틱</b>", links_message)
         self.assertIn("<b>페퍼저축은행</b>", links_message)
-        self.assertIn("when:1d", mock_get.call_args_list[0].kwargs["params"]["q"])
+        self.assertIn("when:1d", rss_query_from_url(mock_get.call_args_list[0].args[0]))
+
+    @patch.dict("os.environ", {"PEF_WATCHLIST_MAX_ARTICLES_PER_COMPANY": "1"}, clear=False)
+    @patch("main.scrape_article_content", return_value="모노틱 관련 기사 본문")
+    @patch("main.fetch_google_news_feeds")
+    def test_watchlist_searches_every_alias_in_one_concurrent_batch(self, mock_feeds, _mock_scrape):
+        def feeds_for(rss_queries, max_entries=None):
+            results = []
+            for rss_query in rss_queries:
+                if "Monotic" in rss_query:
+                    results.append((None, requests.RequestException("timeout")))
+                else:
+                    results.append((SimpleNamespace(entries=[SimpleNamespace(
+                        title=f"{rss_query.split(chr(34))[1]} 기사 - 연합뉴스",
+                        link=f"https://example.com/{len(results)}",
+                        published="2026-08-08",
+                    )]), None))
+            return results
+
+        mock_feeds.side_effect = feeds_for
+        watchlist = [
+            {"name": "모노틱", "aliases": ["Monotic", "모노틱", "모노틱 주식회사"]},
+            {"name": "모노틱 계열", "aliases": ["모노틱"]},
+        ]
+
+        _context, links, _seen, _pending, status = main.fetch_watchlist_news(
+            watchlist,
+            collected_date=date(2026, 8, 8),
+        )
+
+        mock_feeds.assert_called_once()
+        self.assertEqual(len(mock_feeds.call_args.args[0]), 3)
+        self.assertEqual([item["company"] for item in links], ["모노틱"])
+        # The third alias is never consumed once the per-company cap is reached.
+        self.assertEqual(status["queries_attempted"], 3)
+        self.assertEqual(status["queries_failed"], 1)
+
+    @patch.dict("os.environ", {"PEF_WATCHLIST_MAX_ARTICLES_PER_COMPANY": "1"}, clear=False)
+    @patch("main.scrape_article_content")
+    @patch("main.fetch_google_news_feeds")
+    def test_watchlist_scrapes_only_until_the_company_cap_is_filled(self, mock_feeds, mock_scrape):
+        entries = [
+            SimpleNamespace(
+                title=f"기업 소식 {index} - 연합뉴스",
+                link=f"https://example.com/watch-{index}",
+                published="2026-08-08",
+            )
+            for index in range(5)
+        ]
+        mock_feeds.return_value = [(SimpleNamespace(entries=entries), None)]
+        mock_scrape.side_effect = lambda url: (
+            "다른 회사 기사" if url.endswith("-0") else "모노틱 관련 기사 본문"
+        )
+
+        _context, links, _seen, _pending, _status = main.fetch_watchlist_news(
+            [{"name": "모노틱", "aliases": ["모노틱"]}],
+            collected_date=date(2026, 8, 8),
+        )
+
+        self.assertEqual([item["link"] for item in links], ["https://example.com/watch-1"])
+        self.assertEqual(
+            [call.args[0] for call in mock_scrape.call_args_list],
+            ["https://example.com/watch-0", "https://example.com/watch-1"],
+        )
 
     def test_empty_watchlist_links_omit_message(self):
         self.assertIsNone(main.build_watchlist_links_message([]))
 
 
 class FetchStatusTests(unittest.TestCase):
-    @patch("main.requests.get", side_effect=requests.RequestException("network down"))
+    @patch("main.HTTP_SESSION.get", side_effect=requests.RequestException("network down"))
     def test_all_rss_failures_are_reported_as_outage(self, _mock_get):
         context, links, _seen, pending, status = main.fetch_news(target="general")
 
@@ -510,9 +824,47 @@ class FetchStatusTests(unittest.TestCase):
         self.assertIn("뉴스 수집 장애", briefing)
         self.assertNotIn("신규 채택 뉴스 없음", briefing)
 
+    @patch.dict("os.environ", {}, clear=True)
+    @patch("main.scrape_article_content", side_effect=lambda url: f"body of {url}")
+    @patch(
+        "main.parse_google_news_feed",
+        side_effect=lambda response, max_entries=None: response,
+    )
+    @patch("main.HTTP_SESSION.get")
+    def test_concurrent_news_fetch_keeps_query_order_and_counts_failures(
+        self, mock_get, _mock_parse_feed, _mock_scrape
+    ):
+        def fetch(url, timeout=None):
+            query = rss_query_from_url(url).split(" when:")[0]
+            if query == "특징주":
+                raise requests.RequestException("timeout")
+            if query == "미국 증시 마감":
+                time.sleep(0.05)
+            return SimpleNamespace(entries=[SimpleNamespace(
+                title=f"{query} 기사 - 연합뉴스",
+                link=f"https://example.com/{query}",
+                published="2026-08-11",
+            )])
+
+        mock_get.side_effect = fetch
+
+        context, links, _seen, _pending, status = main.fetch_news(
+            mode="weekday",
+            target="general",
+            collected_date=date(2026, 8, 11),
+        )
+
+        self.assertEqual(
+            [title for title, _link in links],
+            ["미국 증시 마감 기사 - 연합뉴스", "국내 증시 전망 기사 - 연합뉴스"],
+        )
+        self.assertIn("body of https://example.com/미국 증시 마감", context)
+        self.assertTrue(main.is_partial_fetch_failure(status))
+        self.assertEqual(status["queries_failed"], 1)
+
     @patch("main.scrape_article_content", return_value="irrelevant body")
     @patch("main.parse_google_news_feed")
-    @patch("main.requests.get", return_value=Mock())
+    @patch("main.HTTP_SESSION.get", return_value=Mock())
     def test_rejected_firm_candidate_is_scraped_once_per_run(
         self, _mock_get, mock_parse_feed, mock_scrape
     ):
@@ -529,6 +881,292 @@ class FetchStatusTests(unittest.TestCase):
         self.assertEqual(result[1], [])
         self.assertGreater(result[4]["queries_succeeded"], 1)
 
+    @patch("main.scrape_article_content")
+    @patch("main.fetch_google_news_feeds")
+    def test_firm_mentions_scrape_a_feed_batch_and_keep_feed_order(self, mock_feeds, mock_scrape):
+        entries = [
+            SimpleNamespace(
+                title=f"바이칼인베스트먼트 투자 소식 {index} - 더벨",
+                link=f"https://example.com/baikal-{index}",
+                published="2026-07-23",
+            )
+            for index in range(main.PEF_FIRM_MENTION_MAX_ARTICLES + 1)
+        ]
+        mock_feeds.return_value = [(SimpleNamespace(entries=entries), None)] + [
+            (SimpleNamespace(entries=[]), None)
+        ] * 10
+
+        def scrape(url):
+            # Earlier articles finish last; the output must still follow feed order.
+            time.sleep(0.01 * (len(entries) - int(url.rsplit("-", 1)[1])))
+            return f"바이칼인베스트먼트 관련 본문 {url}"
+
+        mock_scrape.side_effect = scrape
+
+        with patch.object(main, "find_duplicate_event_title", return_value=None):
+            _context, links, _seen, _pending, _status = main.fetch_firm_mention_news("바이칼인베스트먼트")
+
+        self.assertEqual(
+            [link for _title, link in links],
+            [entry.link for entry in entries[:main.PEF_FIRM_MENTION_MAX_ARTICLES]],
+        )
+
+    @patch.object(main, "PEF_FIRM_MENTION_MAX_ARTICLES", 2)
+    @patch("main.scrape_article_content")
+    @patch("main.fetch_google_news_feeds")
+    def test_firm_mentions_only_scrape_what_the_cap_still_needs(self, mock_feeds, mock_scrape):
+        entries = [
+            SimpleNamespace(
+                title=f"투자 소식 {index} - 더벨",
+                link=f"https://example.com/news-{index}",
+                published="2026-07-23",
+            )
+            for index in range(5)
+        ]
+        mock_feeds.return_value = [(SimpleNamespace(entries=entries), None)] + [
+            (SimpleNamespace(entries=[]), None)
+        ] * 10
+        # The first article does not mention the firm, so one more is fetched to fill the cap.
+        mock_scrape.side_effect = lambda url: (
+            "관련 없는 본문" if url.endswith("-0") else "바이칼인베스트먼트 관련 본문"
+        )
+
+        with patch.object(main, "find_duplicate_event_title", return_value=None):
+            _context, links, _seen, _pending, _status = main.fetch_firm_mention_news("바이칼인베스트먼트")
+
+        self.assertEqual(
+            [link for _title, link in links],
+            ["https://example.com/news-1", "https://example.com/news-2"],
+        )
+        self.assertEqual(
+            sorted(call.args[0] for call in mock_scrape.call_args_list),
+            [f"https://example.com/news-{index}" for index in range(3)],
+        )
+
+
+class HttpSessionTests(unittest.TestCase):
+    def test_cached_session_only_caches_google_news_searches(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            session = main.build_http_session(cache_path=str(Path(temp_dir) / "http_cache"))
+            try:
+                settings = session.settings
+                self.assertEqual(settings.expire_after, requests_cache.DO_NOT_CACHE)
+                self.assertEqual(
+                    settings.urls_expire_after, {"news.google.com/rss/search": 600}
+                )
+                self.assertIn("https://", session.adapters)
+            finally:
+                session.close()
+
+    def test_cached_session_keeps_article_scrapes_capped_and_uncached(self):
+        rss_url = main.build_google_news_rss_url("코스피")
+        pdf_body = TrackedBody(b"%PDF-1.7" + b"\0" * (1024 * 1024))
+        html_body = TrackedBody(b"<html><body>" + b"<p>article body</p>" * 60000 + b"</body></html>")
+        adapter = StubBodyAdapter({
+            rss_url: ("application/rss+xml", io.BytesIO(b"<rss><channel></channel></rss>")),
+            "https://example.com/report.pdf": ("application/pdf", pdf_body),
+            "https://example.com/article": ("text/html; charset=utf-8", html_body),
+        })
+
+        with tempfile.TemporaryDirectory() as temp_dir, patch.dict("os.environ", {}, clear=True):
+            session = main.build_http_session(cache_path=str(Path(temp_dir) / "http_cache"))
+            session.mount("https://", adapter)
+            try:
+                with patch.object(main, "HTTP_SESSION", session):
+                    self.assertIsNone(main.scrape_article_content("https://example.com/report.pdf"))
+                    text = main.scrape_article_content("https://example.com/article")
+                    main.fetch_google_news_feed("코스피")
+                    cached_feed = session.get(rss_url, timeout=10)
+
+                self.assertTrue(text.startswith("article body"))
+                self.assertEqual(pdf_body.bytes_read, 0)
+                self.assertEqual(html_body.bytes_read, main.DEFAULT_ARTICLE_MAX_DOWNLOAD_BYTES)
+                self.assertTrue(cached_feed.from_cache)
+                self.assertEqual(len(session.cache.responses), 1)
+            finally:
+                session.close()
+
+    def test_shared_session_retries_rate_limits_with_capped_retry_after(self):
+        retry = main.HTTP_SESSION.get_adapter("https://news.google.com").max_retries
+
+        self.assertIn(429, retry.status_forcelist)
+        self.assertTrue(retry.respect_retry_after_header)
+        response = Mock(headers={"Retry-After": "3600"})
+        self.assertEqual(retry.get_retry_after(response), main.HTTP_RETRY_AFTER_MAX_SECONDS)
+
+
+class ArticleScrapeTests(unittest.TestCase):
+    @patch("main.HTTP_SESSION.get")
+    def test_scrape_drops_page_chrome_and_decodes_meta_charset(self, mock_get):
+        page = (
+            "<html><head><meta charset='euc-kr'><script>var x = 1;</script></head>"
+            "<body><header>메뉴</header><nav>네비</nav>"
+            "<article><h1>코스피 상승 마감</h1><p>외국인  순매수 확대</p></article>"
+            "<footer>저작권</footer></body></html>"
+        ).encode("euc-kr")
+        mock_get.return_value = Mock(
+            iter_content=Mock(return_value=[page]),
+            headers={"Content-Type": "text/html"},
+            raise_for_status=Mock(),
+        )
+
+        text = main.scrape_article_content("https://example.com/article")
+
+        self.assertEqual(text, "코스피 상승 마감\n외국인\n순매수 확대")
+        self.assertTrue(mock_get.call_args.kwargs["stream"])
+        mock_get.return_value.close.assert_called_once()
+
+    def test_article_text_splits_lines_and_double_spaces(self):
+        page = (
+            "<html><body><div>  첫 줄 \t\r\n\n  둘째  줄 </div>"
+            "<p>셋째 줄</p><p> \n </p><p>넷째\t칸</p></body></html>"
+        ).encode("utf-8")
+
+        text = main.extract_article_text(page, encoding="utf-8")
+
+        self.assertEqual(text, "첫 줄\n둘째\n줄\n셋째 줄\n넷째\t칸")
+
+    def test_response_prefix_stops_reading_at_byte_cap(self):
+        chunks_read = []
+
+        def iter_content(_chunk_size):
+            for index in range(100):
+                chunks_read.append(index)
+                yield b"x" * 1024
+
+        response = Mock(iter_content=iter_content)
+
+        content = main.read_response_prefix(response, 4096)
+
+        self.assertEqual(len(content), 4096)
+        self.assertEqual(len(chunks_read), 4)
+
+    @patch("main.HTTP_SESSION.get")
+    def test_scrape_skips_non_html_responses_without_reading_the_body(self, mock_get):
+        mock_get.return_value = Mock(
+            headers={"Content-Type": "application/pdf"},
+            raise_for_status=Mock(),
+        )
+
+        self.assertIsNone(main.scrape_article_content("https://example.com/report.pdf"))
+        mock_get.return_value.iter_content.assert_not_called()
+        mock_get.return_value.close.assert_called_once()
+
+    def test_rss_parser_stops_after_requested_entries(self):
+        feed_xml = (
+            "<?xml version='1.0' encoding='UTF-8'?><rss version='2.0'><channel><title>feed</title>"
+            "<item><title>첫 기사 &amp; 시장</title><link>https://example.com/1</link>"
+            "<pubDate>Mon, 03 Aug 2026 00:00:00 GMT</pubDate><description>요약</description></item>"
+            "<item><title>둘째 기사</title><link>https://example.com/2</link></item>"
+            "<item><title>셋째 기사</title><link>https://example.com/3</link></item>"
+            "</channel></rss>"
+        ).encode("utf-8")
+        response = Mock(content=feed_xml, raise_for_status=Mock())
+
+        feed = main.parse_google_news_feed(response, max_entries=2)
+
+        self.assertEqual([entry.link for entry in feed.entries], ["https://example.com/1", "https://example.com/2"])
+        self.assertEqual(feed.entries[0].title, "첫 기사 & 시장")
+        self.assertEqual(feed.entries[0].published, "Mon, 03 Aug 2026 00:00:00 GMT")
+        self.assertEqual(feed.entries[1].published, "Unknown")
+
+    def test_rss_url_percent_encodes_korean_query(self):
+        url = main.build_google_news_rss_url("코스피 when:1d")
+
+        self.assertTrue(url.startswith("https://news.google.com/rss/search?q=%EC%BD%94"))
+        self.assertIn("%20when%3A1d", url)
+        self.assertTrue(url.endswith("&hl=ko&gl=KR&ceid=KR%3Ako"))
+        self.assertEqual(rss_query_from_url(url), "코스피 when:1d")
+
+    def test_rss_parser_rejects_non_feed_response(self):
+        response = Mock(content=b"<html><body>unavailable", raise_for_status=Mock())
+
+        with self.assertRaises(ValueError):
+            main.parse_google_news_feed(response)
+
+
+class NewsFetchTests(unittest.TestCase):
+    @patch.dict("os.environ", {}, clear=True)
+    @patch("main.scrape_article_content", return_value="scraped body")
+    @patch("main.fetch_google_news_feeds")
+    def test_long_rss_summary_replaces_the_article_scrape(self, mock_feeds, mock_scrape):
+        long_summary = (
+            "<a href=\"https://example.com/long\">반도체 수출 증가</a> "
+            "<p>" + "7월 반도체 수출이 전년 대비 크게 늘었다. " * 10 + "</p>"
+        )
+        mock_feeds.return_value = [(SimpleNamespace(entries=[
+            SimpleNamespace(
+                title="반도체 수출 증가 - 연합뉴스",
+                link="https://example.com/long",
+                published="2026-08-11",
+                summary=long_summary,
+            ),
+            SimpleNamespace(
+                title="환율 급등 - 한국경제",
+                link="https://example.com/short",
+                published="2026-08-11",
+                summary="<a href=\"https://example.com/short\">환율 급등</a>",
+            ),
+        ]), None)]
+
+        context, _links, _seen, _pending, _status = main.fetch_news(
+            target="general", collected_date=date(2026, 8, 11)
+        )
+
+        mock_scrape.assert_called_once_with("https://example.com/short")
+        self.assertIn("7월 반도체 수출이 전년 대비 크게 늘었다.", context)
+
+        mock_scrape.reset_mock()
+        with patch.dict("os.environ", {"FETCH_FULL_ARTICLES": "true"}):
+            main.fetch_news(target="general", collected_date=date(2026, 8, 11))
+        self.assertEqual(mock_scrape.call_count, 2)
+
+    def test_google_news_cluster_description_is_not_used_as_article_body(self):
+        related = [
+            ("코스피, 외국인 매수에 2700선 회복", "연합뉴스"),
+            ("외국인 5거래일 연속 순매수…반도체 대형주 강세", "한국경제"),
+            ("코스피 2700 회복, 환율 하락에 투자심리 개선", "매일경제"),
+            ("증시 반등 이끈 외국인, 이번주 주목할 업종은", "머니투데이"),
+            ("2700선 되찾은 코스피…하반기 실적 기대감 확산", "서울경제"),
+        ]
+        cluster = "<ol>" + "".join(
+            f'<li><a href="https://news.google.com/rss/articles/CBMi{index}?oc=5" '
+            f'target="_blank">{headline}</a>&nbsp;&nbsp;'
+            f'<font color="#6f6f6f">{publisher}</font></li>'
+            for index, (headline, publisher) in enumerate(related)
+        ) + (
+            '<li><strong><a href="https://news.google.com/stories/CAAqNggK?oc=5" '
+            'target="_blank">Google 뉴스에서 전체 콘텐츠 보기</a></strong></li></ol>'
+        )
+        entry = SimpleNamespace(
+            title="코스피, 외국인 매수에 2700선 회복 - 연합뉴스",
+            link="https://example.com/kospi",
+            summary=cluster,
+        )
+
+        self.assertEqual(main.extract_rss_summary_text(cluster, title=entry.title), "")
+        with patch.dict("os.environ", {}, clear=True), patch(
+            "main.scrape_article_content", return_value="기사 본문"
+        ) as mock_scrape:
+            contents = main.collect_article_contents([entry])
+
+        self.assertEqual(contents, ["기사 본문"])
+        mock_scrape.assert_called_once_with("https://example.com/kospi")
+
+    @patch.dict("os.environ", {}, clear=True)
+    @patch("main.scrape_article_content", return_value="사모펀드 본문")
+    def test_pef_articles_are_always_scraped_for_the_filter(self, mock_scrape):
+        entry = SimpleNamespace(
+            title="사모펀드 경영권 인수 - 더벨",
+            link="https://example.com/pef",
+            summary="<p>" + "사모펀드가 경영권 인수를 추진한다. " * 20 + "</p>",
+        )
+
+        contents = main.collect_article_contents([entry], target="pef")
+
+        self.assertEqual(contents, ["사모펀드 본문"])
+        mock_scrape.assert_called_once_with("https://example.com/pef")
+
 
 class MarketPerformanceTests(unittest.TestCase):
     def setUp(self):
@@ -547,16 +1185,284 @@ class MarketPerformanceTests(unittest.TestCase):
         self.assertEqual(result["period"], "daily")
         self.assertAlmostEqual(result["pct_change"], (110.0 - 105.0) / 105.0 * 100)
 
+    @patch("yfinance.download")
+    def test_market_fetch_uses_one_batch_download(self, mock_download):
+        mock_download.return_value = pd.concat(
+            {symbol: self.history for symbol in main.MARKET_TICKERS.values()},
+            axis=1,
+        )
+
+        data = main.fetch_market_data(mode="weekday")
+
+        mock_download.assert_called_once()
+        self.assertFalse(mock_download.call_args.kwargs["auto_adjust"])
+        self.assertFalse(mock_download.call_args.kwargs["actions"])
+        self.assertEqual(list(data), list(main.MARKET_TICKERS))
+        self.assertAlmostEqual(data["KOSPI"]["pct_change"], (110.0 - 105.0) / 105.0 * 100)
+
+    @patch("yfinance.Ticker")
+    @patch("yfinance.download")
+    def test_symbols_missing_from_batch_are_retried_individually(self, mock_download, mock_ticker):
+        empty_history = pd.DataFrame({"Close": [None] * 4}, index=self.history.index, dtype=float)
+        frames = {
+            symbol: (empty_history if symbol == "^SOX" else self.history)
+            for symbol in main.MARKET_TICKERS.values()
+            if symbol != "BTC-USD"
+        }
+        mock_download.return_value = pd.concat(frames, axis=1)
+        mock_ticker.return_value.history.return_value = self.history
+
+        data = main.fetch_market_data(mode="weekday")
+
+        self.assertEqual(
+            sorted(call.args[0] for call in mock_ticker.call_args_list),
+            ["BTC-USD", "^SOX"],
+        )
+        self.assertEqual(list(data), list(main.MARKET_TICKERS))
+        self.assertTrue(all(performance is not None for performance in data.values()))
+
+    def test_batch_daily_performance_matches_per_ticker_calculation(self):
+        index = pd.to_datetime(["2026-07-16", "2026-07-17", "2026-07-18", "2026-07-19"])
+        histories = {
+            "KS": pd.DataFrame({"Close": [100.0, 102.0, None, None]}, index=index),
+            "BTC": pd.DataFrame({"Close": [50.0, 51.0, 49.0, 52.0]}, index=index),
+            "NEW": pd.DataFrame({"Close": [None, None, None, 7.0]}, index=index),
+            "EMPTY": pd.DataFrame({"Close": [None, None, None, None]}, index=index, dtype=float),
+        }
+        closes = pd.concat(histories, axis=1).xs("Close", axis=1, level=1)
+
+        batch = main.calculate_daily_performance_batch(closes)
+
+        for symbol, history in histories.items():
+            expected = main.calculate_market_performance(history, mode="weekday")
+            if expected is None:
+                self.assertIsNone(batch[symbol])
+                continue
+            for key in ("price", "change", "pct_change"):
+                self.assertAlmostEqual(batch[symbol][key], expected[key])
+            self.assertEqual(batch[symbol]["period"], "daily")
+
+    @patch("yfinance.Ticker")
+    @patch("yfinance.download", side_effect=RuntimeError("batch endpoint down"))
+    def test_market_fetch_falls_back_per_ticker_and_isolates_failures(
+        self, _mock_download, mock_ticker
+    ):
+        def build_ticker(symbol):
+            ticker = Mock()
+            if symbol == "^IXIC":
+                ticker.history.side_effect = RuntimeError("yahoo down")
+            else:
+                ticker.history.return_value = self.history
+            return ticker
+
+        mock_ticker.side_effect = build_ticker
+
+        data = main.fetch_market_data(mode="weekday")
+
+        self.assertEqual(list(data), list(main.MARKET_TICKERS))
+        self.assertIsNone(data["NASDAQ"])
+        self.assertEqual(data["KOSPI"]["period"], "daily")
+
+    @patch("yfinance.Ticker")
+    @patch("yfinance.download")
+    def test_single_level_batch_frame_falls_back_per_ticker(self, mock_download, mock_ticker):
+        mock_download.return_value = self.history
+        mock_ticker.return_value.history.return_value = self.history
+
+        data = main.fetch_market_data(mode="weekday")
+
+        self.assertEqual(mock_ticker.call_count, len(main.MARKET_TICKERS))
+        self.assertEqual(list(data), list(main.MARKET_TICKERS))
+        self.assertEqual(data["KOSPI"]["period"], "daily")
+
+    def test_market_cache_reuses_fresh_snapshots_until_bypassed(self):
+        snapshot = {
+            name: {"price": 100.0, "change": 1.0, "pct_change": 1.0, "period": "daily"}
+            for name in main.MARKET_TICKERS
+        }
+        with tempfile.TemporaryDirectory() as temp_dir, patch.dict(
+            "os.environ",
+            {"MARKET_CACHE_ENABLED": "true", "MARKET_CACHE_DIR": temp_dir},
+        ), patch("main.fetch_market_data", return_value=snapshot) as mock_fetch:
+            first = main.fetch_market_data_cached("weekday", date(2026, 8, 11))
+            second = main.fetch_market_data_cached("weekday", date(2026, 8, 11))
+            main.fetch_market_data_cached("saturday", date(2026, 8, 11))
+            with patch.object(main, "LOCAL_CACHES_BYPASSED", True):
+                main.fetch_market_data_cached("weekday", date(2026, 8, 11))
+
+            path = main.get_market_cache_path(date(2026, 8, 11), "weekday")
+            self.assertIsNone(main.load_cached_market_data(path, now=time.time() + 3600))
+
+        self.assertEqual(first, second)
+        self.assertEqual(mock_fetch.call_count, 3)
+
+    def test_market_snapshot_marks_direction_and_missing_data(self):
+        market_data = {
+            "KOSPI": {"price": 2650.5, "change": 12.0, "pct_change": 0.45},
+            "KOSDAQ": {"price": 870.0, "change": -3.0, "pct_change": -0.34},
+            "USD/KRW": {"price": 1380.0, "change": 0.0, "pct_change": 0.0},
+            "BTC/USD": None,
+        }
+
+        snapshot = main.build_market_snapshot(market_data)
+
+        self.assertEqual(
+            snapshot.splitlines(),
+            [
+                "- KOSPI: 2,650.50 (🔺 0.45%)",
+                "- KOSDAQ: 870.00 (🔻 -0.34%)",
+                "- USD/KRW: 1,380.00 (➖ 0.00%)",
+                "- BTC/USD: Data Unavailable",
+            ],
+        )
+        self.assertEqual(len(main.build_market_snapshot(market_data, max_items=2).splitlines()), 2)
+
 
 class GeminiConfigTests(unittest.TestCase):
+    def setUp(self):
+        main.get_gemini_client.cache_clear()
+        main.get_gemini_generate_config.cache_clear()
+
     @patch.dict("os.environ", {}, clear=True)
     def test_default_models_are_current_and_do_not_include_25_pro(self):
         models = main.get_gemini_models()
         self.assertEqual(models[0], "gemini-3.6-flash")
         self.assertNotIn("gemini-2.5-pro", models)
 
+    @patch("google.genai.Client")
+    def test_identical_prompt_is_served_from_briefing_cache(self, mock_client):
+        generate_content = mock_client.return_value.models.generate_content_stream
+        generate_content.return_value = [
+            SimpleNamespace(text="<b>brief"),
+            SimpleNamespace(text="ing</b>"),
+            SimpleNamespace(text=None),
+        ]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            env = {
+                "GEMINI_API_KEY": "test-key",
+                "GEMINI_MODELS": "test-model",
+                "GEMINI_CACHE_ENABLED": "true",
+                "GEMINI_CACHE_FILE": str(Path(temp_dir) / "gemini_cache.sqlite"),
+            }
+            with patch.dict("os.environ", env, clear=False):
+                first = main.generate_briefing({}, "Title: 기사", briefing_date=date(2026, 8, 8))
+                second = main.generate_briefing({}, "Title: 기사", briefing_date=date(2026, 8, 8))
+                main.generate_briefing({}, "Title: 다른 기사", briefing_date=date(2026, 8, 8))
+
+        self.assertEqual(first, "<b>briefing</b>")
+        self.assertEqual(second, "<b>briefing</b>")
+        self.assertEqual(generate_content.call_count, 2)
+
+    def test_hedged_request_returns_first_successful_model(self):
+        release_slow_model = threading.Event()
+        calls = []
+
+        def request_model(model_name):
+            calls.append(model_name)
+            if model_name == "slow-model":
+                release_slow_model.wait(5)
+                return "slow"
+            return "fast"
+
+        try:
+            result = main.run_hedged_model_requests(
+                ["slow-model", "fast-model"], request_model, hedge_delay=0.01
+            )
+        finally:
+            release_slow_model.set()
+
+        self.assertEqual(result, ("fast-model", "fast"))
+        self.assertEqual(calls, ["slow-model", "fast-model"])
+
+    def test_unhedged_chain_falls_back_only_after_failure(self):
+        calls = []
+
+        def request_model(model_name):
+            calls.append(model_name)
+            return None if model_name == "first" else "second briefing"
+
+        result = main.run_hedged_model_requests(["first", "second", "third"], request_model)
+
+        self.assertEqual(result, ("second", "second briefing"))
+        self.assertEqual(calls, ["first", "second"])
+
+    @patch.dict(
+        "os.environ",
+        {
+            "GEMINI_API_KEY": "test-key",
+            "GEMINI_MODELS": "test-model",
+        },
+        clear=False,
+    )
+    @patch("google.genai.Client")
+    def test_client_is_created_once_per_api_key(self, mock_client):
+        generate_content = mock_client.return_value.models.generate_content_stream
+        generate_content.return_value = [SimpleNamespace(text="<b>briefing</b>")]
+
+        main.generate_briefing({}, "Title: 기사", briefing_date=date(2026, 8, 5))
+        main.generate_briefing({}, "Title: 기사", target="pef", briefing_date=date(2026, 8, 5))
+
+        mock_client.assert_called_once_with(api_key="test-key")
+        self.assertEqual(generate_content.call_count, 2)
+
+        main.generate_briefing({}, "Title: 다른 기사", briefing_date=date(2026, 8, 5))
+        first_config = generate_content.call_args_list[0].kwargs["config"]
+        self.assertIs(generate_content.call_args.kwargs["config"], first_config)
+
+    @patch.dict(
+        "os.environ",
+        {
+            "GEMINI_API_KEY": "test-key",
+            "GEMINI_MODELS": "first-model,last-model",
+            "GEMINI_MAX_ATTEMPTS_PER_MODEL": "2",
+            "GEMINI_TIMEOUT_SECONDS": "30",
+        },
+        clear=False,
+    )
+    @patch("main.time.sleep")
+    @patch("google.genai.Client")
+    def test_only_the_last_model_retries_and_calls_carry_a_timeout(self, mock_client, _mock_sleep):
+        generate_content = mock_client.return_value.models.generate_content_stream
+        generate_content.side_effect = RuntimeError("server error")
+
+        result = main.generate_briefing({}, "Title: 기사", briefing_date=date(2026, 8, 5))
+
+        self.assertTrue(result.startswith("Error:"))
+        self.assertEqual(
+            [call.kwargs["model"] for call in generate_content.call_args_list],
+            ["first-model", "last-model", "last-model"],
+        )
+        config = generate_content.call_args.kwargs["config"]
+        self.assertEqual(config.http_options.timeout, 30000)
+
+    def test_retry_delay_prefers_gemini_retry_info(self):
+        error = RuntimeError(
+            "429 RESOURCE_EXHAUSTED. {'error': {'details': [{'@type': "
+            "'type.googleapis.com/google.rpc.RetryInfo', 'retryDelay': '27s'}]}}"
+        )
+        self.assertEqual(main.get_gemini_retry_delay(error, 5, 0), 27)
+
+        with patch("main.random.uniform", return_value=1.0):
+            self.assertEqual(main.get_gemini_retry_delay(RuntimeError("500"), 5, 2), 21.0)
+            self.assertEqual(
+                main.get_gemini_retry_delay(RuntimeError("500"), 5, 10),
+                main.GEMINI_MAX_RETRY_DELAY_SECONDS,
+            )
+
+    def test_expired_briefing_cache_entry_is_ignored(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            settings = {"path": str(Path(temp_dir) / "cache.sqlite"), "ttl_seconds": 60}
+            main.store_cached_briefing(settings, "key", "cached", now=1000)
+
+            self.assertEqual(main.load_cached_briefing(settings, "key", now=1030), "cached")
+            self.assertIsNone(main.load_cached_briefing(settings, "key", now=1100))
+
 
 class PefBriefingFormatTests(unittest.TestCase):
+    def setUp(self):
+        main.get_gemini_client.cache_clear()
+
     def test_no_news_fallback_has_no_it_pmi_role_or_actions(self):
         status = main.new_fetch_status("pef")
         status.update({"queries_attempted": 1, "queries_succeeded": 1})
@@ -583,13 +1489,13 @@ class PefBriefingFormatTests(unittest.TestCase):
         },
         clear=False,
     )
-    @patch("main.genai.Client")
+    @patch("google.genai.Client")
     def test_watchlist_prompt_section_is_added_only_for_watchlist_articles(
         self,
         mock_client,
     ):
-        generate_content = mock_client.return_value.models.generate_content
-        generate_content.return_value = SimpleNamespace(text="<b>briefing</b>")
+        generate_content = mock_client.return_value.models.generate_content_stream
+        generate_content.return_value = [SimpleNamespace(text="<b>briefing</b>")]
 
         main.generate_briefing(
             {},
@@ -615,6 +1521,30 @@ class PefBriefingFormatTests(unittest.TestCase):
         self.assertIn("관심 기업 뉴스 레이더", watchlist_prompt)
         self.assertIn("Watchlist Company: 모노틱", watchlist_prompt)
 
+    @patch.dict(
+        "os.environ",
+        {
+            "GEMINI_API_KEY": "test-key",
+            "GEMINI_MODELS": "test-model",
+        },
+        clear=False,
+    )
+    @patch("google.genai.Client")
+    def test_static_instructions_are_sent_as_stable_system_instruction(self, mock_client):
+        generate_content = mock_client.return_value.models.generate_content_stream
+        generate_content.return_value = [SimpleNamespace(text="<b>briefing</b>")]
+
+        main.generate_briefing({}, "Title: 기사", briefing_date=date(2026, 8, 5))
+        main.generate_briefing({}, "Title: 기사", briefing_date=date(2026, 8, 6))
+
+        first, second = generate_content.call_args_list
+        first_instruction = first.kwargs["config"].system_instruction
+        self.assertEqual(first_instruction, second.kwargs["config"].system_instruction)
+        self.assertIn("FORBIDDEN TAGS", first_instruction)
+        self.assertNotIn("FORBIDDEN TAGS", first.kwargs["contents"])
+        self.assertIn("08/05", first.kwargs["contents"])
+        self.assertNotIn("08/05", first_instruction)
+
 
 class BondMarketTests(unittest.TestCase):
     def test_parses_dart_toc_and_bond_event(self):
@@ -880,6 +1810,89 @@ class BondMarketTests(unittest.TestCase):
         self.assertIn("금투협 발행정보 수집 실패", section)
         self.assertNotIn("GP 체크", section)
 
+    def test_bond_fetchers_default_to_shared_session(self):
+        with patch.object(
+            main.HTTP_SESSION, "post", side_effect=requests.ConnectionError("offline")
+        ) as mock_post:
+            result = main.fetch_kofia_bond_issuance(reference_date=date(2026, 7, 23))
+
+        mock_post.assert_called_once()
+        self.assertEqual(result["status"], "error")
+
+    @patch("main.fetch_dart_bond_event")
+    @patch("main.parse_dart_debt_list")
+    def test_dart_reports_are_fetched_concurrently_and_failures_isolated(
+        self, mock_list, mock_event
+    ):
+        disclosures = [
+            {
+                "issuer": issuer,
+                "security_type": "회사채",
+                "payment_date": date(2026, 7, 30),
+                "receipt_date": date(2026, 7, 20),
+                "rcp_no": rcp_no,
+                "report_url": f"https://dart.fss.or.kr/?rcpNo={rcp_no}",
+            }
+            for issuer, rcp_no in (("가나다", "1"), ("라마바", "2"), ("사아자", "3"))
+        ]
+        mock_list.return_value = disclosures
+
+        def fetch_event(disclosure, requester, timeout):
+            if disclosure["issuer"] == "라마바":
+                raise ValueError("공모개요 section not found")
+            time.sleep(0.02 if disclosure["issuer"] == "가나다" else 0)
+            return {
+                "issuer": disclosure["issuer"],
+                "demand_date": date(2026, 7, 24),
+                "rcp_no": disclosure["rcp_no"],
+            }
+
+        mock_event.side_effect = fetch_event
+        requester = Mock()
+        requester.post.return_value = Mock(text="", raise_for_status=Mock())
+
+        result = main.fetch_dart_debt_disclosures(date(2026, 7, 23), requester=requester)
+
+        self.assertEqual(mock_event.call_count, 3)
+        self.assertEqual([item["issuer"] for item in result["items"]], ["가나다", "사아자"])
+        self.assertEqual(result["errors"], ["라마바: 공모개요 section not found"])
+        self.assertEqual(result["status"], "partial")
+
+    @patch.dict(
+        "os.environ",
+        {"BOND_DART_MAX_WORKERS": "1", "NEWS_FETCH_MAX_WORKERS": "8"},
+        clear=False,
+    )
+    @patch("main.fetch_dart_bond_event")
+    @patch("main.parse_dart_debt_list")
+    def test_dart_report_pool_uses_its_own_worker_limit(self, mock_list, mock_event):
+        mock_list.return_value = [
+            {
+                "issuer": f"발행사{index}",
+                "security_type": "회사채",
+                "payment_date": date(2026, 7, 30),
+                "receipt_date": date(2026, 7, 20),
+                "rcp_no": str(index),
+                "report_url": f"https://dart.fss.or.kr/?rcpNo={index}",
+            }
+            for index in range(4)
+        ]
+        thread_names = set()
+
+        def fetch_event(disclosure, requester, timeout):
+            thread_names.add(threading.current_thread().name)
+            time.sleep(0.01)
+            return None
+
+        mock_event.side_effect = fetch_event
+        requester = Mock()
+        requester.post.return_value = Mock(text="", raise_for_status=Mock())
+
+        main.fetch_dart_debt_disclosures(date(2026, 7, 23), requester=requester)
+
+        self.assertEqual(mock_event.call_count, 4)
+        self.assertEqual(len(thread_names), 1)
+
     @patch.dict(
         "os.environ",
         {